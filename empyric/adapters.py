@@ -2,12 +2,14 @@ import importlib
 import socket
 import time
 import re
+from contextlib import contextmanager
 
-from threading import Lock
+from threading import Condition, Event, Lock, Thread
+from collections import deque
 
 import numpy as np
 
-from empyric.tools import read_from_socket, write_to_socket, logger
+from empyric.tools import SocketReader, write_to_socket, time_remaining, logger
 
 
 def chaperone(method):
@@ -15,107 +17,167 @@ def chaperone(method):
     Wraps all write, read and query methods of the adapters; monitors and
     handles communication issues.
 
+    After `failure_threshold` consecutive failed communications, the adapter's
+    circuit breaker opens: further communications fail immediately, without
+    waiting on the instrument, while the adapter tries to reconnect in the
+    background (see the `Adapter.breaker_state` attribute).
+
+    Within an experiment step with a deadline (see `tools.step_deadline`), the
+    adapter's timeout is capped to the time remaining and a `DeadlineError` is
+    raised once the deadline has passed, instead of retrying.
+
     :param method: (callable) method to be wrapped
     :return: (callable) wrapped method
     """
 
     def wrapped_method(self, *args, validator=None, **kwargs):
-        self.lock.acquire()
+        if self.breaker_state == "open":
+            raise AdapterError(
+                f"Communication with {self.instrument.name} is suspended after "
+                "repeated failures; reconnecting in the background"
+            )
 
-        traceback = None
+        remaining = time_remaining()
 
-        reconnects = 0
+        if remaining is not None and remaining <= 0:
+            raise DeadlineError(
+                f"Step deadline passed before communicating with "
+                f"{self.instrument.name}"
+            )
 
-        while reconnects < self.max_reconnects:
-            if not self.connected:
+        def communicate():
+            traceback = None
 
-                logger.debug(
-                    f"Connecting to {self.instrument.name} "
-                    f"at {self.instrument.address}"
-                )
+            reconnects = 0
 
-                time.sleep(self.delay * reconnects)
+            while reconnects < self.max_reconnects:
+                if not self.connected:
 
-                try:
-                    self.connect()
-                except Exception as exception:
-                    traceback = exception.__traceback__
-
-                    logger.error(
-                        f"Encountered '{exception}' while trying "
-                        f"to connect to {self.instrument.name}"
+                    logger.debug(
+                        f"Connecting to {self.instrument.name} "
+                        f"at {self.instrument.address}"
                     )
 
-                    continue
+                    time.sleep(self.delay * reconnects)
 
-                reconnects += 1
+                    reconnects += 1
 
-            attempts = 0
+                    try:
+                        self.connect()
+                    except Exception as exception:
+                        traceback = exception.__traceback__
 
-            while attempts < self.max_attempts:
-                try:
+                        logger.error(
+                            f"Encountered '{exception}' while trying "
+                            f"to connect to {self.instrument.name}"
+                        )
 
-                    logger.debug(
-                        f"Communicating with {self.instrument.name} "
-                        f"at {self.instrument.address}: {method}({args})"
-                    )
+                        continue
+
+                attempts = 0
+
+                while attempts < self.max_attempts:
+                    try:
 
-                    response = method(self, *args, **kwargs)
+                        logger.debug(
+                            f"Communicating with {self.instrument.name} "
+                            f"at {self.instrument.address}: {method}({args})"
+                        )
+
+                        response = method(self, *args, **kwargs)
+
+                        if validator and not validator(response):
+                            if hasattr(response, "__len__") and len(response) > 100:
+                                response = (
+                                    str(response[:50]) + "..." + str(response[-50:])
+                                )
 
-                    if validator and not validator(response):
-                        if hasattr(response, "__len__") and len(response) > 100:
-                            response = str(response[:50]) + "..." + str(response[-50:])
+                            raise ValueError(
+                                f"invalid response, {response}, "
+                                f"from {method.__name__} method"
+                            )
 
-                        raise ValueError(
-                            f"invalid response, {response}, "
-                            f"from {method.__name__} method"
+                        elif attempts > 0 or reconnects > 0:
+                            logger.info(
+                                f"Communication issue with {self.instrument.name} "
+                                "is resolved"
+                            )
+
+                        # Successful communication
+
+                        logger.debug(
+                            f"Communication with {self.instrument.name} "
+                            f"at {self.instrument.address} successful "
+                            f"with response: {response}"
                         )
 
-                    elif attempts > 0 or reconnects > 0:
-                        logger.info(
-                            f"Communication issue with {self.instrument.name} "
-                            "is resolved"
+                        return response
+
+                    except Exception as exception:
+                        traceback = exception.__traceback__
+
+                        logger.error(
+                            f"Encountered '{exception}' while trying "
+                            f"to talk to {self.instrument.name}"
                         )
 
-                    # Successful communication
+                        attempts += 1
 
-                    logger.debug(
-                        f"Communication with {self.instrument.name} "
-                        f"at {self.instrument.address} successful "
-                        f"with response: {response}"
-                    )
+                        if remaining is not None and time_remaining() <= 0:
+                            raise DeadlineError(
+                                f"Step deadline passed while communicating with "
+                                f"{self.instrument.name}"
+                            ).with_traceback(traceback)
 
-                    self.lock.release()
-                    return response
+                # getting here means attempts have maxed out;
+                # disconnect adapter and potentially reconnect on next iteration
 
-                except Exception as exception:
-                    traceback = exception.__traceback__
+                logger.debug(
+                    f"Disconnecting from {self.instrument.name} "
+                    f"at {self.instrument.address}"
+                )
 
-                    logger.error(
-                        f"Encountered '{exception}' while trying "
-                        f"to talk to {self.instrument.name}"
-                    )
+                self.disconnect()
 
-                    attempts += 1
+            # Getting here means that both attempts and reconnects have been maxed out
+            # and the communication was unsuccessful
+            raise AdapterError(
+                f"Unable to communicate with {self.instrument.name}! "
+                f"(after {attempts} attempts & {reconnects} reconnects)"
+            ).with_traceback(traceback)
 
-            # getting here means attempts have maxed out;
-            # disconnect adapter and potentially reconnect on next iteration
+        self.lock.acquire()
 
-            logger.debug(
-                f"Disconnecting from {self.instrument.name} "
-                f"at {self.instrument.address}"
-            )
+        capped = failed = False
 
-            self.disconnect()
+        try:
+            # cap the timeout of blocking calls to the time remaining in the step
+            if remaining is not None and self.caps_timeout:
+                timeout = self.timeout
+
+                if timeout is None or timeout > remaining:
+                    self.timeout = remaining
+                    capped = True
+
+            response = communicate()
+        except DeadlineError:
+            raise
+        except AdapterError:
+            failed = True
+            raise
+        finally:
+            try:
+                if capped:
+                    self.timeout = timeout
+            finally:
+                self.lock.release()
 
-        # Getting here means that both attempts and reconnects have been maxed out
-        # and the communication was unsuccessful
-        self.lock.release()
+            if failed:
+                self._record_failure()
 
-        raise AdapterError(
-            f"Unable to communicate with {self.instrument.name}! "
-            f"(after {attempts} attempts & {reconnects} reconnects)"
-        ).with_traceback(traceback)
+        self._close_breaker()
+
+        return response
 
     wrapped_method.__doc__ = method.__doc__  # keep method doc string
 
@@ -126,6 +188,10 @@ class AdapterError(ConnectionError):
     pass
 
 
+class DeadlineError(AdapterError):
+    """Raised when the deadline of an experiment step passes during communication"""
+
+
 class Adapter:
     """
     Base class for all adapters
@@ -139,7 +205,7 @@ class Adapter:
     # in the event of a communication error
     max_reconnects = 1
 
-    kwargs = []
+    kwargs = ["write_interval", "chain_queries", "fixed_delay", "failure_threshold"]
 
     # Library used by adapter; overwritten in children classes.
     lib = "python"
@@ -150,6 +216,39 @@ class Adapter:
 
     delay = 0.1  # delay between successive communication attempts
 
+    #: Whether to always wait the full delay between writing a query and reading
+    # the response; otherwise, the response is read as soon as it is ready, waiting
+    # at most the delay if the adapter can check for readiness (see the
+    # `_wait_for_response` method)
+    fixed_delay = False
+
+    #: Minimum time between knob writes to the instrument; writes arriving sooner
+    # are held by the knob and applied once the interval has passed
+    write_interval = 0.0
+
+    #: Whether to chain the queries of an instrument's meters into a single request
+    # on each experiment step (see the `prefetch` method)
+    chain_queries = False
+
+    #: Number of consecutive failed communications after which the circuit breaker
+    # opens, suspending communications while reconnecting in the background
+    failure_threshold = 3
+
+    #: Initial and maximum intervals between background reconnection attempts
+    reconnect_interval = 1.0
+    max_reconnect_interval = 60.0
+
+    #: State of the circuit breaker: 'closed' if communicating normally, 'open' if
+    # communications are suspended, or 'half-open' if reconnected and the next
+    # communication is a trial
+    breaker_state = "closed"
+
+    _failures = 0  # consecutive failed communications
+
+    #: Whether the instrument bus has service requests (see the `wait_for_srq`
+    # method); overwritten in children classes.
+    srq_capable = False
+
     def __init__(self, instrument, **kwargs):
         if self.lib is None:
             # determined by class attribute `lib`
@@ -162,6 +261,13 @@ class Adapter:
         self.repeats = 0
         self.reconnects = 0
 
+        self._prefetched = {}  # responses of chained queries
+
+        # set to stop reconnecting in the background (see `stop_reconnecting`)
+        self._reconnection_stopped = Event()
+
+        self.response_times = deque(maxlen=100)  # times taken by recent queries
+
         for key, value in kwargs.items():
             self.__setattr__(key, value)
 
@@ -245,11 +351,350 @@ class Adapter:
         :return: instrument response
         """
 
+        if len(args) == 1 and not kwargs and args[0] in self._prefetched:
+            return self._prefetched.pop(args[0])
+
         if hasattr(self, "_query"):
-            return self._query(*args, **kwargs)
+            start = time.perf_counter()
+
+            response = self._query(*args, **kwargs)
+
+            self.response_times.append(time.perf_counter() - start)
+
+            return response
         else:
             raise AttributeError(self.__name__ + " adapter has no _query method")
 
+    @property
+    def response_time_stats(self):
+        """
+        Statistics of the times taken by recent queries, which can be used to
+        tune the adapter's delay and timeout
+
+        :return: (dict) number of queries, and the mean, median and maximum times
+                 in seconds
+        """
+
+        times = np.array(self.response_times)
+
+        if len(times) == 0:
+            return {"count": 0, "mean": np.nan, "median": np.nan, "max": np.nan}
+
+        return {
+            "count": len(times),
+            "mean": np.mean(times),
+            "median": np.median(times),
+            "max": np.max(times),
+        }
+
+    def _wait_for_response(self, ready=None):
+        """
+        Wait after writing a query until the response is ready to be read. If the
+        `fixed_delay` attribute is True, the full delay is waited. Otherwise, if a
+        `ready` function is given, it is polled with increasing intervals until it
+        returns True or the delay has passed. Otherwise, there is no wait, since
+        the read itself waits for the response up to the timeout.
+
+        :param ready: (callable) function that returns True if a response is
+                      ready to be read, e.g. if bytes are waiting in a buffer
+        :return: None
+        """
+
+        if self.fixed_delay:
+            time.sleep(self.delay)
+            return
+
+        if ready is None:
+            return
+
+        deadline = time.perf_counter() + self.delay
+        interval = 5e-4
+
+        while not ready():
+            remaining = deadline - time.perf_counter()
+
+            if remaining <= 0:
+                break
+
+            time.sleep(min(interval, remaining))
+            interval = min(2 * interval, 0.02)
+
+    @chaperone
+    def query_block(
+        self,
+        question,
+        dtype="u1",
+        prefix=b"",
+        termination=b"",
+        allow_empty=False,
+        validator=None,
+    ):
+        """
+        Submit a query whose response is an IEEE 488.2 definite length binary
+        block, i.e. '#' followed by the number of digits of the data length, the
+        data length and then the data. The data is read into a preallocated
+        buffer, and returned as a numpy array over that buffer without copying.
+
+        :param question: (str) query string
+        :param dtype: (str/np.dtype) data type of the elements of the block
+        :param prefix: (bytes) any bytes expected before the block, e.g. a
+                       response header
+        :param termination: (bytes) any bytes expected after the block, which are
+                            read and discarded
+        :param allow_empty: (bool) whether to return None if there is no response,
+                            e.g. if the instrument has no data, rather than failing
+        :param validator: (callable) function that returns True if its input
+                          looks right or False if it does not
+
+        :return: (numpy.ndarray) block data, or None if there is no response and
+                 `allow_empty` is True
+        """
+
+        self._write(question)
+        self._wait_for_response()
+
+        return self._read_block(
+            dtype=dtype, prefix=prefix, termination=termination, allow_empty=allow_empty
+        )
+
+    def _read_block(self, dtype="u1", prefix=b"", termination=b"", allow_empty=False):
+        # Reading the first byte on its own tells an empty response apart from an
+        # incomplete one
+        try:
+            header = self._read_exactly(1)
+        except ConnectionError:
+            raise
+        except Exception:
+            if allow_empty:
+                return None
+            raise
+
+        header += self._read_exactly(len(prefix) + 1)
+
+        if header[: len(prefix)] != prefix or header[-2:-1] != b"#":
+            raise ValueError(f"invalid binary block header {bytes(header)}")
+
+        digits = int(header[-1:])
+
+        if digits == 0:
+            raise ValueError(
+                "indefinite length binary blocks (#0) are not supported; the "
+                "instrument must be set to send definite length blocks"
+            )
+
+        length = int(self._read_exactly(digits))
+
+        data = self._read_exactly(length)
+
+        if termination:
+            end = self._read_exactly(len(termination))
+
+            if end != termination:
+                raise ValueError(f"invalid binary block termination {bytes(end)}")
+
+        return np.frombuffer(data, dtype=dtype)
+
+    def _read_exactly(self, nbytes):
+        buffer = bytearray(nbytes)
+
+        if nbytes > 0:
+            if hasattr(self, "_read_into"):
+                self._read_into(buffer)
+            else:
+                raise AttributeError(
+                    self.__class__.__name__ + " adapter has no _read_into method"
+                )
+
+        return buffer
+
+    def _record_failure(self):
+        # Open the circuit breaker upon repeated failures
+        self._failures += 1
+
+        if self._failures >= self.failure_threshold and self.breaker_state != "open":
+            logger.warning(
+                f"Suspending communication with {self.instrument.name} after "
+                f"{self._failures} consecutive failures; reconnecting in the "
+                "background"
+            )
+
+            self.breaker_state = "open"
+
+            if not self._reconnection_stopped.is_set():
+                Thread(target=self._reconnect_in_background, daemon=True).start()
+
+    def _close_breaker(self):
+        self._failures = 0
+
+        if self.breaker_state != "closed":
+            logger.info(f"Communication with {self.instrument.name} is restored")
+
+            self.breaker_state = "closed"
+
+    def _reconnect_in_background(self):
+        # Try to reconnect at increasing intervals; once reconnected, the breaker
+        # is half-open, so that the next communication is a trial that closes the
+        # breaker if successful, or opens it again otherwise
+
+        interval = self.reconnect_interval
+
+        while self.breaker_state == "open":
+            if self._reconnection_stopped.wait(interval):
+                return
+
+            with self.lock:
+                if self._reconnection_stopped.is_set():
+                    return
+
+                try:
+                    if self.connected:
+                        self.disconnect()
+
+                    self.connect()
+                except Exception as exception:
+                    logger.debug(
+                        f"Unable to reconnect to {self.instrument.name}: {exception}"
+                    )
+                else:
+                    logger.info(
+                        f"Reconnected to {self.instrument.name}; resuming "
+                        "communication on trial"
+                    )
+
+                    self._failures = self.failure_threshold - 1
+                    self.breaker_state = "half-open"
+
+            interval = min(2 * interval, self.max_reconnect_interval)
+
+    def stop_reconnecting(self):
+        """
+        Stop any attempts to reconnect in the background after repeated failures,
+        so that ports are not reopened once the instrument is intentionally
+        disconnected
+
+        :return: None
+        """
+
+        self._reconnection_stopped.set()
+
+    @property
+    def caps_timeout(self):
+        """
+        Whether the adapter's timeout, in seconds, can be capped to the time
+        remaining before a step deadline (see the `chaperone` function)
+        """
+        return hasattr(self, "timeout")
+
+    @property
+    def supports_srq(self):
+        """Whether the adapter can wait for service requests from the instrument"""
+        return self.srq_capable and self.lib == "pyvisa"
+
+    def wait_for_srq(self, command=None, timeout=60):
+        """
+        Wait for a service request from the instrument, without holding the
+        adapter's lock so that other threads can communicate in the meantime.
+
+        :param command: (str) command to write once the adapter is ready to receive
+                        the service request, e.g. '*OPC'
+        :param timeout: (float) maximum time to wait in seconds; if None, there is
+                        no limit
+
+        :return: (bool) True if a service request was received, or False upon
+                 timeout
+        """
+
+        if not self.supports_srq:
+            raise AdapterError(f"{self} adapter does not support service requests")
+
+        constants = importlib.import_module("pyvisa.constants")
+        errors = importlib.import_module("pyvisa.errors")
+
+        event_type = constants.EventType.service_request
+
+        self.backend.enable_event(event_type, constants.EventMechanism.queue)
+
+        try:
+            if command is not None:
+                self.write(command)
+
+            # wait no longer than the time remaining in the step, if any
+            remaining = time_remaining()
+
+            if remaining is not None:
+                if timeout is None or timeout > remaining:
+                    timeout = max(remaining, 0)
+
+            if timeout is None:
+                timeout_ms = constants.VI_TMO_INFINITE
+            else:
+                timeout_ms = 1000 * timeout
+
+            try:
+                self.backend.wait_on_event(event_type, timeout_ms)
+                return True
+            except errors.VisaIOError as error:
+                if error.error_code == constants.StatusCode.error_timeout:
+                    return False
+                raise error
+
+        finally:
+            self.backend.discard_events(event_type, constants.EventMechanism.queue)
+            self.backend.disable_event(event_type, constants.EventMechanism.queue)
+
+    def prefetch(self, questions, separator=";"):
+        """
+        Submit several SCPI queries chained into a single request, and store the
+        responses so that subsequent calls of the `query` method with the same
+        questions return them without communicating with the instrument. If the
+        response cannot be split into the expected number of parts, chaining is
+        disabled for the adapter and queries are submitted individually thereafter.
+
+        :param questions: (list) query strings, e.g. 'MEAS:VOLT?'
+        :param separator: (str) separator between responses
+        :return: None
+        """
+
+        questions = list(dict.fromkeys(questions))  # remove duplicates
+
+        if len(questions) < 2:
+            return
+
+        chained_query = (separator + ":").join(
+            question.lstrip(":") for question in questions
+        )
+
+        response = self.query(chained_query)
+
+        if isinstance(response, str):
+            responses = response.strip().split(separator)
+        else:
+            responses = []
+
+        if len(responses) != len(questions):
+            logger.info(
+                f"Unable to split response {response} to chained query "
+                f"{chained_query} for {self.instrument.name}; "
+                "submitting queries individually instead"
+            )
+
+            self.chain_queries = False
+            return
+
+        self._prefetched = {
+            question: response.strip()
+            for question, response in zip(questions, responses)
+        }
+
+    def discard_prefetched(self):
+        """
+        Discard any unused responses to chained queries
+
+        :return: None
+        """
+
+        self._prefetched = {}
+
     def disconnect(self):
         """
         Close communication port/channel.
@@ -267,7 +712,7 @@ class Serial(Adapter):
     """
 
     baud_rate = 9600
-    timeout = 0.1
+    _timeout = 0.1
     delay = 0.1
     parity = "N"
     stop_bits = 1
@@ -295,6 +740,21 @@ class Serial(Adapter):
         "No serial library was found! " "Please install either PySerial or PyVISA."
     )
 
+    @property
+    def timeout(self):
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout):
+        if self.backend is not None:
+            if self.lib == "pyvisa":
+                # pyvisa records timeouts in milliseconds
+                self.backend.timeout = None if timeout is None else 1000 * timeout
+            elif self.lib == "pyserial":
+                self.backend.timeout = timeout
+
+        self._timeout = timeout
+
     def connect(self):
         # First try connecting with PyVISA
         if self.lib == "pyvisa":
@@ -388,9 +848,19 @@ class Serial(Adapter):
 
     def _query(self, question, bytes=None, until=None, decode=True):
         self._write(question)
-        time.sleep(self.delay)
+        self._wait_for_response(ready=lambda: self.in_waiting > 0)
         return self._read(bytes=bytes, until=until, decode=decode)
 
+    def _read_into(self, buffer):
+        if self.lib == "pyvisa":
+            nbytes = len(buffer)
+            buffer[:] = self.backend.read_bytes(nbytes)
+        elif self.lib == "pyserial":
+            nbytes = self.backend.readinto(buffer)
+
+        if nbytes < len(buffer):
+            raise TimeoutError("timed out while reading from serial port")
+
     def disconnect(self):
         if self.lib == "pyvisa":
             IOerror = importlib.import_module("pyvisa").errors.VisaIOError
@@ -486,6 +956,8 @@ class GPIB(Adapter):
     uses PySerial to facilitate communications.
     """
 
+    srq_capable = True
+
     # Enumerated timeout values (in seconds) allowed by the Linux-GPIB backend
     linux_gpib_timeouts = {
         0: None,
@@ -555,6 +1027,12 @@ class GPIB(Adapter):
         else:
             self._timeout = None
 
+    @property
+    def caps_timeout(self):
+        # the timeout is discarded while disconnected, and Prologix controllers are
+        # shared by several instruments
+        return self.connected and self.lib in ["pyvisa", "linux-gpib"]
+
     def connect(self):
         if self.prologix_address is not None:
             self.lib = "prologix-gpib"
@@ -644,29 +1122,29 @@ class GPIB(Adapter):
 
         if self.lib == "pyvisa":
             self.backend.write(question)
-            time.sleep(self.delay)
+            self._wait_for_response()
             response = self.backend.read()
         elif self.lib == "linux-gpib":
             self.backend.write(self._descr, question)
-            time.sleep(self.delay)
+            self._wait_for_response()
             response = self.backend.read(self._descr, bytes).decode()
         elif self.lib == "prologix-gpib":
 
             with self.backend.lock:
                 self.backend.write(question, address=self.instrument.address)
-                time.sleep(self.delay)
+                self._wait_for_response()
                 response = self.backend.read(address=self.instrument.address)
 
         return response
 
     def _linux_gpib_set_timeout(self, timeout):
         if timeout is None:
-            self.backend.timeout(self.descr, 0)
+            self.backend.timeout(self._descr, 0)
             return None
         else:
-            for index, allowed_timeout in self.linux_gpib_timeouts.items()[1:]:
+            for index, allowed_timeout in list(self.linux_gpib_timeouts.items())[1:]:
                 if allowed_timeout >= timeout:
-                    self.backend.timeout(self.descr, index)
+                    self.backend.timeout(self._descr, index)
                     break
 
             return allowed_timeout
@@ -810,6 +1288,8 @@ class PrologixGPIBLAN:
 
         self.socket.settimeout(1)
 
+        self.reader = SocketReader(self.socket)
+
         # set adapter to "controller" mode
         self.write("mode 1", to_controller=True)
 
@@ -861,7 +1341,7 @@ class PrologixGPIBLAN:
         if not from_controller:
             self.write(f"read eoi", to_controller=True)
 
-        return read_from_socket(self.socket)
+        return self.reader.read()
 
     def close(self):
         self.socket.shutdown(socket.SHUT_RDWR)
@@ -873,6 +1353,8 @@ class USB(Adapter):
     Handles communications with pure USB instruments through PyVISA or USBTMC.
     """
 
+    srq_capable = True
+
     # Get USB library
     if importlib.util.find_spec("pyvisa"):
         lib = "pyvisa"
@@ -932,13 +1414,27 @@ class USB(Adapter):
         self.backend.write(message)
         return "Success"
 
-    def _read(self):
-        return self.backend.read()
+    def _read(self, decode=True):
+        if decode:
+            return self.backend.read()
+        else:
+            return self.backend.read_raw()
 
-    def _query(self, question):
+    def _query(self, question, decode=True):
         self._write(question)
-        time.sleep(self.delay)
-        return self._read()
+        self._wait_for_response()
+        return self._read(decode=decode)
+
+    def _read_into(self, buffer):
+        if self.lib == "pyvisa":
+            data = self.backend.read_bytes(len(buffer))
+        elif self.lib == "usbtmc":
+            data = self.backend.read_raw(len(buffer))
+
+        if len(data) != len(buffer):
+            raise ValueError(f"expected {len(buffer)} bytes but got {len(data)}")
+
+        buffer[:] = data
 
     def disconnect(self):
         self.backend.close()
@@ -979,6 +1475,8 @@ class Socket(Adapter):
 
         self.backend.connect((remote_ip_address, int(remote_port)))
 
+        self.reader = SocketReader(self.backend)
+
         self.connected = True
 
     def _write(self, message):
@@ -995,21 +1493,22 @@ class Socket(Adapter):
         termination = kwargs.pop("termination", self.read_termination)
         timeout = kwargs.pop("timeout", self.timeout)
 
-        return read_from_socket(
-            self.backend, termination=termination, timeout=timeout, **kwargs
-        )
+        return self.reader.read(termination=termination, timeout=timeout, **kwargs)
 
     def _query(self, question, **kwargs):
         self._write(question)
         return self._read(**kwargs)
 
+    def _read_into(self, buffer):
+        self.reader.read_into(buffer, timeout=self.timeout)
+
     def disconnect(self):
-        # Clear out any unread messages
+        # Discard any unread messages, both buffered by the reader and waiting in
+        # the socket, without waiting for more to arrive
+        self.reader.clear()
 
         try:
-            unread = self._read(decode=False, nbytes=np.inf, timeout=1)
-            while unread:
-                unread = self._read(decode=False, nbytes=np.inf, timeout=1)
+            self.reader.read(termination=lambda data: False, timeout=0, decode=False)
         except ConnectionError:
             pass
 
@@ -1123,10 +1622,103 @@ class ModbusSerial(Adapter):
         return Serial.locate()
 
 
+class _ModbusSerialBus:
+    """
+    Schedules the transactions of Modbus adapters sharing a serial port, so that
+    only one frame is on the bus at a time, the bus is silent for at least the
+    inter-frame gap between frames, and slaves with pending transactions take
+    turns (round-robin) rather than competing for the bus in arbitrary order.
+    """
+
+    def __init__(self, baud_rate):
+        # Modbus RTU frames are separated by at least 3.5 character times (11 bits
+        # per character), or 1.75 ms for baud rates above 19200
+        self.gap = max(3.5 * 11 / baud_rate, 1.75e-3)
+
+        self.busy = False
+
+        self._condition = Condition()
+        self._queues = {}  # pending transactions of each slave, in order
+        self._turns = deque()  # slaves with pending transactions, in turn order
+        self._last_frame = 0.0  # time of the end of the last transaction
+
+    @contextmanager
+    def transaction(self, slave_id):
+        """
+        Context manager waiting for the turn of a slave on the bus, and releasing
+        the bus to the next slave upon exit
+
+        :param slave_id: (int) slave ID of the transaction
+        """
+
+        ticket = object()
+
+        with self._condition:
+            queue = self._queues.setdefault(slave_id, deque())
+
+            if not queue:
+                self._turns.append(slave_id)
+
+            queue.append(ticket)
+
+            while self.busy or self._turns[0] != slave_id or queue[0] is not ticket:
+                remaining = time_remaining()
+
+                if remaining is not None and remaining <= 0:
+                    self._cancel(slave_id, ticket)
+
+                    raise DeadlineError(
+                        f"Step deadline passed while waiting for slave {slave_id} "
+                        "to take its turn on the bus"
+                    )
+
+                self._condition.wait(remaining)
+
+            self.busy = True
+
+            queue.popleft()
+            self._turns.popleft()
+
+            if queue:
+                self._turns.append(slave_id)  # next transaction waits its turn
+            else:
+                del self._queues[slave_id]
+
+        try:
+            silence = time.monotonic() - self._last_frame
+
+            if silence < self.gap:
+                time.sleep(self.gap - silence)
+
+            yield
+        finally:
+            with self._condition:
+                self._last_frame = time.monotonic()
+                self.busy = False
+
+                self._condition.notify_all()
+
+    def _cancel(self, slave_id, ticket):
+        """Withdraw a pending transaction"""
+
+        queue = self._queues[slave_id]
+
+        queue.remove(ticket)
+
+        if not queue:
+            del self._queues[slave_id]
+            self._turns.remove(slave_id)
+
+        self._condition.notify_all()
+
+
 class Modbus(Adapter):
     """
     Handles communication with instruments via the Modbus communication
     protocol, over either TCP, UDP, or serial ports, using PyModbus.
+
+    Adapters of instruments sharing a serial port use the same client, and their
+    transactions are scheduled fairly among the slaves on the bus.
     """
 
     kwargs = (
@@ -1140,6 +1732,8 @@ class Modbus(Adapter):
         "parity",
         "delay",
         "protocol",
+        "max_read_count",
+        "register_gap",
     )
 
     slave_id = 0
@@ -1161,6 +1755,22 @@ class Modbus(Adapter):
         "64bit_float",
     ]
 
+    # NumPy type codes of the data types, which are encoded to and decoded from
+    # blocks of registers as arrays (see the `_encode` and `_decode` methods)
+    _type_codes = {
+        "8bit_uint": "u1",
+        "16bit_uint": "u2",
+        "32bit_uint": "u4",
+        "64bit_uint": "u8",
+        "8bit_int": "i1",
+        "16bit_int": "i2",
+        "32bit_int": "i4",
+        "64bit_int": "i8",
+        "16bit_float": "f2",
+        "32bit_float": "f4",
+        "64bit_float": "f8",
+    }
+
     baud_rate = 19200
     timeout = 0.05
     byte_size = 8
@@ -1170,12 +1780,33 @@ class Modbus(Adapter):
 
     protocol = None
 
+    #: Reads of the meters of an instrument are merged into as few requests as
+    # possible on each experiment step (see the `prefetch` method)
+    chain_queries = True
+
+    #: Maximum number of registers in a merged read; the Modbus protocol allows
+    # at most 125 registers (or 2000 coils) per request, but some devices allow less
+    max_read_count = 125
+
+    #: Maximum number of unrequested registers (or coils) between address ranges
+    # that are merged into one read; only increase it for devices that allow
+    # reading the addresses in between
+    register_gap = 0
+
     # This dict contains all active Modbus serial adapters. When a new adapter
     # is initialized with the same com port as an existing one, it uses the
     # same Modbus client object as its backend (they are differentiated by
     # their slave IDs).
     _serial_adapters = {}
 
+    # Transaction schedulers of the serial ports in use
+    _serial_buses = {}
+
+    #: Transaction scheduler of the serial port, if the adapter uses one
+    bus = None
+
+    _busy = False
+
     # Locate PyModbus library
     if importlib.util.find_spec("pymodbus"):
         lib = "pymodbus"
@@ -1184,16 +1815,9 @@ class Modbus(Adapter):
 
     @property
     def busy(self):
-        address = self.instrument.address.split("::")
-        if self.protocol == "Serial":
-            return bool(
-                sum(
-                    [
-                        adapter._busy
-                        for adapter in Modbus._serial_adapters.get(address[0], [])
-                    ]
-                )
-            )
+        if self.bus is not None:
+            # any of the adapters on the serial port is communicating
+            return self.bus.busy
         else:
             return self._busy
 
@@ -1260,13 +1884,18 @@ class Modbus(Adapter):
                 port, self.slave_id = address
 
             if port in Modbus._serial_adapters:
-                Modbus._serial_adapters[port].append(self)
+                if self not in Modbus._serial_adapters[port]:
+                    Modbus._serial_adapters[port].append(self)
 
-                # use existing backend
+                # use existing backend, reopening it if another adapter closed it
                 self.backend = Modbus._serial_adapters[port][0].backend
 
+                if not self.backend.connected:
+                    self.backend.connect()
+
             else:
                 Modbus._serial_adapters[port] = [self]
+                Modbus._serial_buses[port] = _ModbusSerialBus(self.baud_rate)
 
                 self.backend = client.ModbusSerialClient(
                     port=port,
@@ -1278,14 +1907,24 @@ class Modbus(Adapter):
 
                 self.backend.connect()
 
-        # Get data reading/writing utility classes
-        payload_module = importlib.import_module(".payload", package="pymodbus")
+            self.bus = Modbus._serial_buses[port]
 
-        # Utility for encoding data
-        self._builder_cls = payload_module.BinaryPayloadBuilder
+    def _request(self, function, *args, **kwargs):
+        """
+        Submit a request to the instrument, waiting for the turn of the slave if
+        the adapter shares a serial bus with others
+
+        :param function: (callable) function of the client that submits the request
+        :param args: any arguments of the function
+        :param kwargs: any keyword arguments of the function
+        :return: response to the request
+        """
 
-        # Utility for decoding data
-        self._decoder_cls = payload_module.BinaryPayloadDecoder
+        if self.bus is None:
+            return function(*args, slave=self.slave_id, **kwargs)
+
+        with self.bus.transaction(self.slave_id):
+            return function(*args, slave=self.slave_id, **kwargs)
 
     def _write(self, func_code, address, values, _type="16bit_uint"):
         """
@@ -1321,7 +1960,7 @@ class Modbus(Adapter):
                     "[values] must have a length of 1"
                 )
 
-            response = self.backend.write_coil(address, bool_value, slave=self.slave_id)
+            response = self._request(self.backend.write_coil, address, bool_value)
 
             if response.function_code == 5:
                 return "Success"
@@ -1338,9 +1977,7 @@ class Modbus(Adapter):
                     "[values] must have a length greater than 1"
                 )
 
-            response = self.backend.write_coils(
-                address, bool_values, slave=self.slave_id
-            )
+            response = self._request(self.backend.write_coils, address, bool_values)
 
             if response.function_code == 15:
                 return "Success"
@@ -1350,17 +1987,10 @@ class Modbus(Adapter):
                 )
         elif func_code == 16 or func_code == 6:
             # Write multiple registers
-            builder = self._builder_cls(
-                byteorder=self.byte_order, wordorder=self.word_order
-            )
-
-            for value in values:
-                builder.__getattribute__("add_" + _type)(value)
-
-            register_values = builder.to_registers()
+            register_values = self._encode(values, _type)
 
-            response = self.backend.write_registers(
-                address, register_values, slave=self.slave_id
+            response = self._request(
+                self.backend.write_registers, address, register_values
             )
 
             if response.function_code == 16:
@@ -1383,7 +2013,8 @@ class Modbus(Adapter):
         A single data unit is read by specifying the function code
         (`func_code`) and address; the data can be converted to the desired
         data type (`_type` = `int` or `float`). Multiple sequential addresses
-        are read by specifying the count.
+        are read by specifying the count. If `_type` is None, the raw register
+        values are returned.
         """
 
         if _type and _type not in self.types:
@@ -1399,12 +2030,18 @@ class Modbus(Adapter):
             4: self.backend.read_input_registers,
         }
 
+        # Values read beforehand along with other meters (see `prefetch` method)
+        prefetched = self._prefetched.pop((func_code, address, count), None)
+
         if func_code in [1, 2]:
             # Read coils or discrete inputs
 
-            response = read_functions[func_code](
-                address, count=count, slave=self.slave_id
-            ).bits
+            if prefetched is not None:
+                response = prefetched
+            else:
+                response = self._request(
+                    read_functions[func_code], address, count=count
+                ).bits
 
             bits = [bool(bit) for bit in response][:count]
 
@@ -1415,19 +2052,19 @@ class Modbus(Adapter):
 
         elif func_code in [3, 4]:
             # Read holding registers or input registers
-            registers = read_functions[func_code](
-                address, count=count, slave=self.slave_id
-            ).registers
+            if prefetched is not None:
+                registers = prefetched
+            else:
+                registers = self._request(
+                    read_functions[func_code], address, count=count
+                ).registers
 
-            decoder = self._decoder_cls.fromRegisters(
-                registers, byteorder=self.byte_order, wordorder=self.word_order
-            )
+            if _type is None:  # raw register values
+                return registers
 
             n_values = int(16 * count / (int(_type.split("bit")[0])))
 
-            values = [
-                decoder.__getattribute__("decode_" + _type)() for _ in range(n_values)
-            ]
+            values = self._decode(registers, _type, n_values)
 
             if len(values) == 1:
                 return values[0]
@@ -1445,6 +2082,151 @@ class Modbus(Adapter):
         """Alias of `_read` method"""
         return self._read(*args, **kwargs)
 
+    def _encode(self, values, _type):
+        """
+        Encode values of the given data type into register values, according to
+        the byte and word orders of the adapter
+
+        :param values: (array) values to encode
+        :param _type: (str) data type; one of the values of the `types` attribute
+        :return: (list) register values
+        """
+
+        code = self._type_codes[_type]
+
+        values = np.asarray(values)
+
+        if code[0] in "ui":
+            info = np.iinfo(code)
+
+            if np.any(values != np.round(values)):
+                raise ValueError(f"non-integer values {values} for type {_type}")
+
+            if np.any(values < info.min) or np.any(values > info.max):
+                raise ValueError(f"values {values} out of range for type {_type}")
+
+        data = values.astype(">" + code).view(">u2" if code[1] != "1" else "u1")
+
+        if code[1] == "1":  # bytes are packed into registers in order
+            data = np.append(data, np.zeros(data.size % 2, dtype="u1")).view(">u2")
+        else:
+            data = self._reorder(data.reshape(len(values), -1))
+
+        return data.flatten().tolist()
+
+    def _decode(self, registers, _type, count):
+        """
+        Decode register values into values of the given data type, according to
+        the byte and word orders of the adapter
+
+        :param registers: (list) register values
+        :param _type: (str) data type; one of the values of the `types` attribute
+        :param count: (int) number of values to decode
+        :return: (list) decoded values
+        """
+
+        code = self._type_codes[_type]
+
+        data = np.asarray(registers, dtype=">u2")
+
+        if 2 * data.size < count * int(code[1]):
+            raise ValueError(
+                f"{len(registers)} registers are too few to decode {count} "
+                f"values of type {_type}"
+            )
+
+        if code[1] == "1":  # bytes are unpacked from registers in order
+            data = data.view("u1")[:count]
+        else:
+            words = int(code[1]) // 2
+
+            data = self._reorder(data[: count * words].reshape(count, words))
+
+        return data.view(">" + code).flatten().tolist()
+
+    def _reorder(self, words):
+        """
+        Convert between the big-endian words of values and the register layout
+        given by the byte and word orders of the adapter; the conversion is its
+        own inverse
+
+        :param words: (numpy.ndarray) 16-bit words with one row per value
+        :return: (numpy.ndarray) contiguous array of reordered words
+        """
+
+        if self.byte_order == "<":
+            words = words.byteswap()
+
+        if self.word_order == "<":
+            words = words[:, ::-1]
+
+        return np.ascontiguousarray(words)
+
+    def prefetch(self, questions):
+        """
+        Read the coils or registers of several meters in as few requests as
+        possible, and store the values so that subsequent calls of the `read`
+        method for the same address ranges return them without communicating
+        with the instrument. Address ranges with the same function code are merged
+        if they are contiguous or overlapping (or separated by at most
+        `register_gap` addresses), up to `max_read_count` registers per read.
+
+        :param questions: (list) tuples of the form (function code, address,
+                          count), matching the arguments of the `read` method
+        :return: None
+        """
+
+        questions = list(dict.fromkeys(tuple(question) for question in questions))
+
+        for func_code, start, count, members in self._plan_reads(questions):
+            if len(members) < 2:
+                continue  # nothing to gain
+
+            values = self.read(func_code, start, count=count, _type=None)
+
+            for question in members:
+                offset = question[1] - start
+
+                self._prefetched[question] = values[offset : offset + question[2]]
+
+    def _plan_reads(self, questions):
+        """
+        Merge the address ranges of reads into as few reads as possible
+
+        :param questions: (list) tuples of the form (function code, address,
+                          count)
+        :return: (list) reads of the form [function code, start address, count,
+                 merged questions]
+        """
+
+        reads = []
+
+        for question in sorted(questions):
+            func_code, address, count = question
+
+            if func_code in [1, 2]:
+                limit = 16 * self.max_read_count  # coils are packed 16 to a register
+            else:
+                limit = self.max_read_count
+
+            if reads:
+                last = reads[-1]
+
+                end = max(last[1] + last[2], address + count)
+
+                if (
+                    func_code == last[0]
+                    and address <= last[1] + last[2] + self.register_gap
+                    and end - last[1] <= limit
+                ):
+                    last[2] = end - last[1]
+                    last[3].append(question)
+                    continue
+
+            reads.append([func_code, address, count, [question]])
+
+        return reads
+
     def disconnect(self):
         while self.connected:
             self.backend.close()
@@ -1,4 +1,5 @@
 import re
+import time
 import numpy as np
 
 from empyric.tools import logger
@@ -350,6 +351,12 @@ class MKSGSeries(Instrument):
         "temperature",  # temperature in degrees C
     )
 
+    chained_queries = {
+        "flow rate": (4, 0x4000, 2),
+        "temperature": (4, 0x4002, 2),
+        "valve position": (4, 0x4004, 2),
+    }
+
     @setter
     def set_setpoint(self, setpoint: Float):
         self.write(16, 0xA000, setpoint, _type="32bit_float")
@@ -396,6 +403,12 @@ class AlicatMFC(Instrument):
         # depending on device configuration)
     )
 
+    chained_queries = {
+        "pressure": (4, 1202, 2),
+        "temperature": (4, 1204, 2),
+        "flow rate": (4, 1208, 2),
+    }
+
     @setter
     def set_setpoint(self, setpoint: Float):
         self.write(16, 1009, setpoint, _type="32bit_float")
@@ -441,6 +454,15 @@ class SynaccessNetbooter(Instrument):
         "port 16 toggle",
     )
 
+    #: Time in seconds for which a snapshot of the port statuses is used by the
+    # getters, instead of querying the statuses of all ports again
+    status_lifetime = 1.0
+
+    # Snapshot of the port statuses, updated in place by the setters, and the
+    # time when it was taken
+    _port_statuses = None
+    _port_statuses_time = -np.inf
+
     def _set_port_n_toggle(self, n, state):
         if state != ON and state != OFF:
             raise ValueError(
@@ -453,7 +475,17 @@ class SynaccessNetbooter(Instrument):
         elif state == OFF:
             self.write("$A3 %d 0" % n)
 
-    def _get_port_n_toggle(self, n):
+        if self._port_statuses is not None:
+            self._port_statuses[n - 1] = state
+
+    def _get_port_statuses(self):
+        # The status query returns all ports at once, so a recent snapshot serves
+        # the getters of all ports, e.g. at initialization or in the GUI
+        age = time.monotonic() - self._port_statuses_time
+
+        if self._port_statuses is not None and age < self.status_lifetime:
+            return self._port_statuses
+
         # Dump buffer (this device sends out a Telnet handshake upon initial
         # connection and periodically transmits null bytes, possibly as a
         # keep-alive signal)
@@ -465,11 +497,17 @@ class SynaccessNetbooter(Instrument):
         status_message = self.query("$A5", termination=termination, decode=False)
 
         # Port statuses are a sequence of 0s and 1s, starting from the right
-        statuses = re.search(b"A0,\d+", status_message)[0]
+        statuses = re.search(b"A0,\d+", status_message)[0].decode().split(",")[1]
+
+        self._port_statuses = [
+            ON if int(status) == 1 else OFF for status in reversed(statuses)
+        ]
+        self._port_statuses_time = time.monotonic()
 
-        port_n_toggle = ON if int(statuses.decode()[-n]) == 1 else OFF
+        return self._port_statuses
 
-        return port_n_toggle
+    def _get_port_n_toggle(self, n):
+        return self._get_port_statuses()[n - 1]
 
     @setter
     def set_port_1_toggle(self, state: Toggle):
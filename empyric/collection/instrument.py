@@ -1,9 +1,11 @@
+import time
 import typing
 from threading import RLock
 from functools import wraps
+from contextlib import contextmanager
 
 from empyric.tools import logger
-from empyric.types import recast, Type, ON, OFF, Toggle
+from empyric.types import caster, Type, ON, OFF, Toggle
 from empyric.adapters import Adapter, AdapterError
 
 
@@ -36,6 +38,8 @@ def setter(method):
 
     logger.debug(f'Knob {" ".join(knob.split("_"))} dtype is {dtype}')
 
+    cast = caster(dtype)
+
     @wraps(method)
     def wrapped_method(*args, **kwargs):
 
@@ -54,7 +58,7 @@ def setter(method):
         try:
 
             args = list(args)
-            args[1] = recast(args[1], to=dtype)
+            args[1] = cast(args[1])
 
             logger.debug(f"Setting {knob} on {self.name} to {value}")
 
@@ -69,9 +73,9 @@ def setter(method):
                     f"is {returned_value} instead of applied value {value}"
                 )
 
-                self.__setattr__(knob, recast(returned_value, to=dtype))
+                self.__setattr__(knob, cast(returned_value))
             else:
-                self.__setattr__(knob, recast(value, to=dtype))
+                self.__setattr__(knob, cast(value))
         finally:
             self.lock.release()
 
@@ -94,6 +98,8 @@ def getter(method):
 
     logger.debug(f'Knob {" ".join(knob.split("_"))} dtype is {dtype}')
 
+    cast = caster(dtype)
+
     @wraps(method)
     def wrapped_method(*args, **kwargs):
         self = args[0]
@@ -111,7 +117,7 @@ def getter(method):
 
             logger.debug(f"Getting value of {knob} on {self.name}...")
 
-            value = recast(method(*args, **kwargs), to=dtype)
+            value = cast(method(*args, **kwargs))
 
             logger.debug(f"Retrieved value of {knob} on {self.name} is {value}")
         except AttributeError as err:
@@ -151,6 +157,8 @@ def measurer(method):
 
     logger.debug(f'Meter {" ".join(meter.split("_"))} dtype is {dtype}')
 
+    cast = caster(dtype)
+
     @wraps(method)
     def wrapped_method(*args, **kwargs):
         self = args[0]
@@ -166,7 +174,7 @@ def measurer(method):
 
             logger.debug(f"Measuring value of {meter} on {self.name}...")
 
-            value = recast(method(*args, **kwargs), to=dtype)
+            value = cast(method(*args, **kwargs))
 
             logger.debug(f"Measured value of {meter} on {self.name} is {value}")
         except AttributeError as err:
@@ -190,6 +198,62 @@ def measurer(method):
     return wrapped_method
 
 
+def acquisition(method):
+    """
+    Utility function that wraps methods which acquire several quantities from the
+    instrument in a single transaction, such as the values of a group of meters.
+
+    While the instrument is in a step (see ``Instrument.start_step``), the result of
+    the first call of the method is stored and returned by any subsequent calls with
+    the same arguments, so that the group of meters shares a single transaction.
+    Otherwise, each call communicates with the instrument.
+
+    :param method: (callable) method to be wrapped
+
+    :return: wrapped method
+    """
+
+    @wraps(method)
+    def wrapped_method(self, *args):
+        if self._acquisitions is None:  # not in a step
+            return method(self, *args)
+
+        key = (method.__name__, args)
+
+        with self.lock:
+            if key not in self._acquisitions:
+                self._acquisitions[key] = method(self, *args)
+
+            return self._acquisitions[key]
+
+    return wrapped_method
+
+
+@contextmanager
+def released(lock):
+    """
+    Context manager that fully releases a reentrant lock held by the current thread,
+    however many times it was acquired, and then reacquires it as many times
+
+    :param lock: (threading.RLock) lock to release
+    """
+
+    count = 0
+
+    while True:
+        try:
+            lock.release()
+            count += 1
+        except RuntimeError:  # not held (anymore) by this thread
+            break
+
+    try:
+        yield
+    finally:
+        for _ in range(count):
+            lock.acquire()
+
+
 class Instrument:
     """
     Basic representation of an instrument, essentially a set of knobs and meters
@@ -213,6 +277,14 @@ class Instrument:
       to apply when the instrument is deleted.
     * ``meters``: tuple of the names of all meters that can be measured on
       this instrument.
+    * ``chained_queries``: dictionary mapping names of meters to the SCPI queries
+      submitted by their ``measure_[meter]`` methods, for instruments that accept
+      several queries chained into one request. If the adapter's ``chain_queries``
+      attribute is True, experiments submit the queries of all of the instrument's
+      meters in one request on each step (see ``Adapter.prefetch``). For Modbus
+      instruments, the values are tuples of the function code, address and count
+      of the registers read by each meter, which are merged into as few reads as
+      possible (see ``Modbus.prefetch``).
 
     Every knob of an instrument has an associated ``set_[knob]`` method, which sends
     commands to the physical instrument that change the value of the knob to the given
@@ -237,6 +309,10 @@ class Instrument:
     floating point number, the ``measurer`` function additionally converts whatever the
     bare ``measure_temperature`` method returns to a 64-bit floating point value.
 
+    Methods that acquire several meter values in one transaction can be wrapped by
+    the ``acquisition`` function defined above, so that within each step of an
+    experiment the meters share a single transaction.
+
     """
 
     name = "Instrument"
@@ -251,8 +327,13 @@ class Instrument:
 
     meters = tuple()
 
+    chained_queries = {}
+
     ignore_errors = False
 
+    # results of acquisitions in the current step, or None if not in a step
+    _acquisitions = None
+
     def __init__(
         self, address=None, adapter=None, presets=None, postsets=None, **kwargs
     ):
@@ -392,6 +473,97 @@ class Instrument:
             else:
                 raise adapter_error
 
+    def wait_until(self, condition, timeout=60, interval=0.01, max_interval=1.0):
+        """
+        Wait until a condition is met, e.g. an operation of the instrument is
+        complete, checking at exponentially increasing intervals. The instrument's
+        lock is released while waiting, so that other threads can use the
+        instrument and its adapter in the meantime.
+
+        :param condition: (callable) function with no arguments that returns True
+                          if the condition is met, and False otherwise
+        :param timeout: (float) maximum time to wait in seconds; if None, there is
+                        no limit
+        :param interval: (float) initial interval between checks in seconds
+        :param max_interval: (float) maximum interval between checks in seconds
+
+        :return: (bool) True if the condition was met, or False upon timeout
+        """
+
+        start = time.perf_counter()
+
+        while not condition():
+            if timeout is not None:
+                remaining = timeout - (time.perf_counter() - start)
+
+                if remaining <= 0:
+                    logger.warning(f"Timed out while waiting for {self.name}")
+                    return False
+
+                interval = min(interval, remaining)
+
+            with released(self.lock):
+                time.sleep(interval)
+
+            interval = min(2 * interval, max_interval)
+
+        return True
+
+    def wait_for_operation_complete(self, timeout=60):
+        """
+        Wait until all pending operations of an IEEE 488.2 compliant instrument are
+        complete. If the adapter supports service requests, the instrument is set
+        to request service upon completion; otherwise, the operation complete bit
+        of the standard event status register is polled (see the `wait_until`
+        method).
+
+        :param timeout: (float) maximum time to wait in seconds; if None, there is
+                        no limit
+
+        :return: (bool) True if operations are complete, or False upon timeout
+        """
+
+        if self.adapter.supports_srq:
+            # request service upon setting the operation complete event status bit
+            self.write("*ESE 1")
+            self.write("*SRE 32")
+
+            with released(self.lock):
+                completed = self.adapter.wait_for_srq("*OPC", timeout=timeout)
+
+            self.query("*ESR?")  # clears the event status register
+
+            if not completed:
+                logger.warning(f"Timed out while waiting for {self.name}")
+
+            return completed
+
+        else:
+            self.write("*OPC")
+
+            return self.wait_until(
+                lambda: int(self.query("*ESR?")) & 1, timeout=timeout
+            )
+
+    def start_step(self):
+        """
+        Start a step, e.g. of an experiment, during which the results of methods
+        wrapped by the ``acquisition`` function are shared among the meters
+
+        :return: None
+        """
+
+        self._acquisitions = {}
+
+    def end_step(self):
+        """
+        End a step, discarding the results of acquisitions made therein
+
+        :return: None
+        """
+
+        self._acquisitions = None
+
     def set(self, knob: str, value):
         """
         Set the value of a knob on the instrument
@@ -472,6 +644,8 @@ class Instrument:
         :return: None
         """
 
+        self.adapter.stop_reconnecting()
+
         if self.adapter.connected:
             for knob, value in self.postsets.items():
                 try:
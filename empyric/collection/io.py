@@ -1,8 +1,16 @@
 import re
 
-from empyric.types import recast, Float
+import numpy as np
+
+from empyric.types import recast, Float, Array
 from empyric.adapters import Socket, Modbus
-from empyric.collection.instrument import Instrument, setter, getter, measurer
+from empyric.collection.instrument import (
+    Instrument,
+    setter,
+    getter,
+    measurer,
+    acquisition,
+)
 
 
 class BrainboxesED560(Instrument):
@@ -160,66 +168,86 @@ class ADAM6024(Instrument):
 
     AOUT_TYPES = {"0~20mA": 0x00, "4~20mA": 0x01, "0~10V": 0x02}
 
+    # (span, lower end) of each input and output type
+    AIN_RANGES = {"4~20mA": (16.0, 4.0), "+/-10V": (20.0, -10.0), "0~20mA": (20.0, 0.0)}
+    AOUT_RANGES = {"0~20mA": (20.0, 0.0), "4~20mA": (16.0, 4.0), "0~10V": (10.0, 0.0)}
+
+    def __init__(self, *args, **kwargs):
+        # Input and output types are cached, and only read from the module if
+        # unknown, i.e. at first use or after being set
+        self._AIN_types = {}
+        self._AOUT_types = {}
+
+        Instrument.__init__(self, *args, **kwargs)
+
+    @acquisition
+    def _measure_AIN_all(self) -> Array:
+        if len(self._AIN_types) < 6:
+            # read all six type registers at once
+            ain_types_rev = {val: key for key, val in self.AIN_TYPES.items()}
+
+            type_values = self.read(4, 200, count=6, _type="16bit_uint")
+
+            for n, type_value in enumerate(type_values):
+                if type_value not in ain_types_rev:
+                    raise TypeError("Unrecognized Type")
+
+                self._AIN_types[n] = ain_types_rev[type_value]
+
+        spans, lower_ends = np.array(
+            [self.AIN_RANGES[self._AIN_types[n]] for n in range(6)]
+        ).T
+
+        raw = np.array(self.read(4, 0, count=6, _type="16bit_uint"))
+
+        return raw / 65535.0 * spans + lower_ends
+
     def _measure_AIN(self, n) -> Float:
-        raw = self.read(4, n, _type="16bit_uint")
-        match self._get_AIN_type(n):
-            case "4~20mA":
-                return raw / 65535.0 * 16 + 4
-            case "+/-10V":
-                return raw / 65535.0 * 20 - 10
-            case "0~20mA":
-                return raw / 65535.0 * 20
-            case _:
-                raise TypeError("Unrecognized Type")
-                return None
+        return self._measure_AIN_all()[n]
+
+    def _AOUT_range(self, n):
+        if n not in self._AOUT_types:
+            self._get_AOUT_type(n)
+
+        return self.AOUT_RANGES[self._AOUT_types[n]]
 
     def _set_AOUT(self, n, value) -> Float:
-        match self._get_AOUT_type(n):
-            case "0~20mA":
-                scaled_value = int((value) / 20.0 * ((2**12) - 1))
-            case "4~20mA":
-                scaled_value = int((value - 4) / 16.0 * ((2**12) - 1))
-            case "0~10V":
-                scaled_value = int((value) / 10.0 * ((2**12) - 1))
-            case _:
-                scaled_value = None
-                raise TypeError("Unrecognized Type")
+        span, lower_end = self._AOUT_range(n)
+        scaled_value = int((value - lower_end) / span * ((2**12) - 1))
         return self.write(6, 10 + n, scaled_value, _type="16bit_uint")
 
     def _get_AOUT(self, n) -> Float:
         raw = self.read(4, 10 + n, _type="16bit_uint")
-        match self._get_AOUT_type(n):
-            case "0~20mA":
-                return raw / float(2**12 - 1) * 20
-            case "4~20mA":
-                return raw / float(2**12 - 1) * 16 + 4
-            case "0~10V":
-                return raw / float(2**12 - 1) * 10
-            case _:
-                raise TypeError("Unrecognized Type")
-                return None
+        span, lower_end = self._AOUT_range(n)
+        return raw / float(2**12 - 1) * span + lower_end
 
     def _set_AIN_type(self, n, str_value: str) -> Float:
         if str_value in self.AIN_TYPES.keys():
             value = self.AIN_TYPES[str_value]
+            self._AIN_types.pop(n, None)  # read back on next use
             return self.write(6, 200 + n, value, _type="16bit_uint")
         else:
             raise TypeError(f"Value not in [{self.AIN_TYPES}]")
 
     def _get_AIN_type(self, n) -> str:
         ain_types_rev = {val: key for key, val in self.AIN_TYPES.items()}
-        return ain_types_rev[self.read(4, 200 + n, _type="16bit_uint")]
+        self._AIN_types[n] = ain_types_rev[self.read(4, 200 + n, _type="16bit_uint")]
+        return self._AIN_types[n]
 
     def _set_AOUT_type(self, n, str_value) -> Float:
         if str_value in self.AOUT_TYPES.keys():
             value = self.AOUT_TYPES[str_value]
+            self._AOUT_types.pop(n, None)  # read back on next use
             return self.write(6, 208 + n, value, _type="16bit_uint")
         else:
             raise TypeError(f"Value not in [{self.AOUT_TYPES}]")
 
     def _get_AOUT_type(self, n) -> str:
         aout_types_rev = {val: key for key, val in self.AOUT_TYPES.items()}
-        return aout_types_rev[self.read(4, 208 + n, _type="16bit_uint")]
+        self._AOUT_types[n] = aout_types_rev[
+            self.read(4, 208 + n, _type="16bit_uint")
+        ]
+        return self._AOUT_types[n]
 
     @setter
     def set_analog_out0(self, value: Float):
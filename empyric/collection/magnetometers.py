@@ -3,7 +3,7 @@ import numpy as np
 
 from empyric.types import Float
 from empyric.adapters import Serial
-from empyric.instruments import Instrument, measurer
+from empyric.instruments import Instrument, measurer, acquisition
 
 
 class AlphaLabMR3(Instrument):
@@ -26,6 +26,7 @@ class AlphaLabMR3(Instrument):
         "magnitude",  # magnitude of the magnetic field
     )
 
+    @acquisition
     def _measure_field(self) -> list:
         """Get the magnetic field vector"""
 
@@ -1,12 +1,17 @@
 import importlib
 import numbers
 import re
-import time
 import numpy as np
 
 from empyric.types import Float, String, Integer, Array, recast
 from empyric.adapters import Socket, USB, Adapter, Modbus
-from empyric.collection.instrument import Instrument, setter, getter, measurer
+from empyric.collection.instrument import (
+    Instrument,
+    setter,
+    getter,
+    measurer,
+    acquisition,
+)
 
 
 class Keithley2110(Instrument):
@@ -319,8 +324,6 @@ class Keithley6500(Instrument):
             "trigger.model.initiate()\n"
         )
 
-        running = True
-
         running_states = [
             "trigger.STATE_BUILDING",
             "trigger.STATE_RUNNING",
@@ -336,14 +339,16 @@ class Keithley6500(Instrument):
 
         state = ""
 
-        while running:
+        def stopped():
+            nonlocal state
+
             self.write("state, state, block_num = trigger.model.state()")
 
             state = self.query("print(state)")
 
-            running = state in running_states
+            return state not in running_states
 
-            time.sleep(0.25)
+        self.wait_until(stopped, timeout=None, max_interval=0.25)
 
         if state in failed_states:
             raise RuntimeError(f'fast measurement failed; trigger state is "{state}"')
@@ -533,6 +538,8 @@ class LabJackT7(Instrument):
         "AIN13_EF",
     )
 
+    chained_queries = {f"AIN{n}_EF": (3, 7000 + 2 * n, 2) for n in range(14)}
+
     def _set_DION(self, n, value: Integer):
         self.write(16, 2000 + n, int(value), _type="16bit_uint")
 
@@ -603,8 +610,16 @@ class LabJackT7(Instrument):
     def get_DIO7(self) -> Integer:
         return self._get_DION(7)
 
+    @acquisition
+    def _measure_AIN_all(self) -> Array:
+        return self.read(4, 0, count=2 * 14, _type="32bit_float")
+
     def _measure_AIN(self, n) -> Float:
-        return self.read(3, 2 * n, count=2, _type="32bit_float")
+        if self._acquisitions is None:  # not in a step; read only this input
+            return self.read(3, 2 * n, count=2, _type="32bit_float")
+
+        # within a step, the inputs are read together and shared among the meters
+        return self._measure_AIN_all()[n]
 
     @measurer
     def measure_AIN0(self) -> Float:
@@ -665,7 +680,7 @@ class LabJackT7(Instrument):
     @measurer
     def measure_AIN_all(self) -> Array:
         """Reads all 14 analog inputs in a single call"""
-        return self.read(4, 0, count=2 * 14, _type="32bit_float")
+        return self._measure_AIN_all()
 
     def _set_DACN(self, n, value: Float):
         self.write(16, 1000 + 2 * n, value, _type="32bit_float")
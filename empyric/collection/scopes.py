@@ -66,6 +66,10 @@ class TekTDSScope(Instrument):
         elif self.model in self.four_channel_models:
             self.channels = 4
 
+        # Waveform preambles of each channel, which are only queried again
+        # after a scale or position is set
+        self._preambles = {}
+
         super().__init__(*args, **kwargs)
 
     # Horizontal
@@ -73,6 +77,7 @@ class TekTDSScope(Instrument):
     @setter
     def set_horz_scale(self, scale: Float):
         self.write("HOR:SCA %.3e" % scale)
+        self._preambles.clear()
 
     @getter
     def get_horz_scale(self) -> Float:
@@ -81,6 +86,7 @@ class TekTDSScope(Instrument):
     @setter
     def set_horz_position(self, position: Float):
         self.write("HOR:POS %.3e" % position)
+        self._preambles.clear()
 
     @getter
     def get_horz_position(self) -> Float:
@@ -91,6 +97,7 @@ class TekTDSScope(Instrument):
     @setter
     def set_ch1_scale(self, scale: Float):
         self.write("CH1:SCA %.3e" % scale)
+        self._preambles.clear()
 
     @getter
     def get_ch1_scale(self) -> Float:
@@ -99,6 +106,7 @@ class TekTDSScope(Instrument):
     @setter
     def set_ch1_position(self, position: Float):
         self.write("CH1:POS %.3e" % position)
+        self._preambles.clear()
 
     @getter
     def get_ch1_position(self) -> Float:
@@ -113,6 +121,7 @@ class TekTDSScope(Instrument):
     @setter
     def set_ch2_scale(self, scale: Float):
         self.write("CH2:SCA %.3e" % scale)
+        self._preambles.clear()
 
     @getter
     def get_ch2_scale(self) -> Float:
@@ -121,6 +130,7 @@ class TekTDSScope(Instrument):
     @setter
     def set_ch2_position(self, position: Float):
         self.write("CH2:POS %.3e" % position)
+        self._preambles.clear()
 
     @getter
     def get_ch2_position(self) -> Float:
@@ -136,6 +146,7 @@ class TekTDSScope(Instrument):
     def set_ch3_scale(self, scale: Float):
         if self.channels > 2:
             self.write("CH3:SCA %.3e" % scale)
+            self._preambles.clear()
         else:
             return np.nan
 
@@ -150,6 +161,7 @@ class TekTDSScope(Instrument):
     def set_ch3_position(self, position: Float):
         if self.channels > 2:
             self.write("CH3:POS %.3e" % position)
+            self._preambles.clear()
         else:
             return np.nan
 
@@ -173,6 +185,7 @@ class TekTDSScope(Instrument):
     def set_ch4_scale(self, scale: Float):
         if self.channels > 2:
             self.write("CH4:SCA %.3e" % scale)
+            self._preambles.clear()
         else:
             return np.nan
 
@@ -187,6 +200,7 @@ class TekTDSScope(Instrument):
     def set_ch4_position(self, position: Float):
         if self.channels > 2:
             self.write("CH4:POS %.3e" % position)
+            self._preambles.clear()
         else:
             return np.nan
 
@@ -215,30 +229,31 @@ class TekTDSScope(Instrument):
         return float(self.query("TRIG:MAI:LEV?"))
 
     def _measure_channel(self, n):
-        self.write("DAT:ENC ASCI")  # ensure ASCII encoding of data
-        self.write("DAT:SOU CH%d" % n)  # switch to channel n
+        # signed binary data, one byte per point
+        self.write("DAT:ENC RIB;WID 1;SOU CH%d" % n)
+
+        if n not in self._preambles:
+            # scale factor, zero and offset
+            self._preambles[n] = [
+                float(value)
+                for value in self.query("WFMPRE:YMULT?;YZERO?;YOFF?").split(";")
+            ]
 
-        scale_factor = float(self.query("WFMPRE:YMULT?"))
-        zero = float(self.query("WFMPRE:YZERO?"))
-        offset = float(self.query("WFMPRE:YOFF?"))
+        scale_factor, zero, offset = self._preambles[n]
 
         self.write("ACQ:STATE RUN")  # acquire the waveform
 
-        while int(self.query("BUSY?")):
-            time.sleep(0.25)  # wait for acquisition to complete
+        self.wait_for_operation_complete()
 
         normal_timeout = self.adapter.timeout
         self.adapter.timeout = 60
 
-        response = self.query("CURVE?")
-
-        str_data = response.split(",")
-
-        self.adapter.timeout = normal_timeout
+        try:
+            data = self.adapter.query_block("CURVE?", dtype="i1", termination=b"\n")
+        finally:
+            self.adapter.timeout = normal_timeout
 
-        return np.array(
-            [(float(datum) - offset) * scale_factor + zero for datum in str_data]
-        )
+        return (data - offset) * scale_factor + zero
 
 
 class MulticompProScope(Instrument):
@@ -249,7 +264,7 @@ class MulticompProScope(Instrument):
     """
 
     supported_adapters = (
-        (USB, {"delay": 1}),
+        (USB, {"delay": 1, "fixed_delay": True}),
         # acquisitions can take a long time
     )
     """Supported adapters and options."""
@@ -486,11 +501,9 @@ class MulticompProScope(Instrument):
     def _read_preamble(self, channel):
         info_dict = {}
 
-        preamble = self.query(":WAV:PRE?", binary=True)
+        info = self.adapter.query_block(":WAV:PRE?").tobytes()
 
-        header, info = preamble[:11], preamble[11:]
-
-        if header != b"#9000000000":  # indicates empty data buffer
+        if info:  # otherwise the data buffer is empty
             try:
                 # First 8 bytes is an integer signature, used for verification
                 ver_int = 651058244139746640
@@ -526,7 +539,7 @@ class MulticompProScope(Instrument):
                     f"reading from channel {channel}"
                 )
 
-        self._sample_rate = info["sample rate"]
+        self._sample_rate = info_dict.get("sample rate")
 
         return info_dict
 
@@ -547,16 +560,9 @@ class MulticompProScope(Instrument):
         if resolution < 256000:  # can get all data in one pass
             self.write(":WAV:RANG 0, %d" % resolution)
 
-            raw_response = self.query(":WAV:FETC?", binary=True)
-
-            header, byte_data = raw_response[:11], raw_response[11:]
+            raw_data = self.adapter.query_block(":WAV:FETC?", dtype="<i2")
 
-            data_len = int(header[2:]) // 2
-
-            voltages = scale * (
-                np.array(struct.unpack(f"<{data_len}h", byte_data), dtype=float) / 6400
-                - zero
-            )
+            voltages = scale * (raw_data / 6400 - zero)
 
         else:  # need to read data in chunks; max chunk size is 256k
             offset, size = 0, 200000
@@ -566,17 +572,9 @@ class MulticompProScope(Instrument):
             while offset + size <= resolution:
                 self.write(":WAV:RANG %d, %d" % (offset, size))
 
-                raw_response = self.query(":WAV:FETC?", binary=True)
-
-                header, byte_data = raw_response[:11], raw_response[11:]
-
-                data_len = int(header[2:]) // 2
+                raw_data = self.adapter.query_block(":WAV:FETC?", dtype="<i2")
 
-                voltages[offset : offset + size] = scale * (
-                    np.array(struct.unpack(f"<{data_len}h", byte_data), dtype=float)
-                    / 6400
-                    - zero
-                )
+                voltages[offset : offset + size] = scale * (raw_data / 6400 - zero)
 
                 offset += size
 
@@ -949,10 +947,7 @@ class SiglentSDS1000(Instrument):
 
     # Channel measurements
     def _measure_chn_waveform(self, n):
-        ready = False
-        while not ready:
-            time.sleep(0.25)
-            ready = "1" in self.query("*OPC?")
+        self.wait_until(lambda: "1" in self.query("*OPC?"))
 
         # Enable channel if needed
         ch_enabled_query = self.query("C%d:TRA?" % n)
@@ -962,74 +957,17 @@ class SiglentSDS1000(Instrument):
 
         self.write("WFSU SP,0,NP,0,FP,0")  # setup to get all data points
 
-        def is_terminated(message):
-            try:
-                size = int(message[13:22])
-            except ValueError:
-                return False
-
-            data_length = len(message[22:-2])
-
-            if data_length == size:
-                return True
-            else:
-                return False
-
-        self.adapter.read_termination = is_terminated
-        max_attempts = self.adapter.max_attempts
-        self.adapter.max_attempts = 1
-
-        def validator(response):
-            """
-            Checks for correct header, size, message length and termination.
-            """
-
-            if response == b"":
-                return True  # no data
-
-            if response is None:
-                return False
-            elif len(response) == 0:
-                return False
-
-            header = response[:13]
-            if header != (b"C%d:WF DAT2,#9" % n):
-                print("invalid header", header)
-                return False
-
-            size = response[13:22]
-            try:
-                size = int(size)
-            except ValueError:
-                print("invalid data size", size)
-                return False
-
-            data = response[22:-2]
-            if len(data) != size:
-                print("truncated data", len(data))
-                return False
-
-            termination = response[-2:]
-            if termination != b"\n\n":
-                print("no termination", response[-2:])
-                return False
-
-            return True
-
-        response = self.query("C%d:WF? DAT2" % n, decode=False, validator=validator)
+        waveform = self.adapter.query_block(
+            "C%d:WF? DAT2" % n,
+            dtype="i1",
+            prefix=b"C%d:WF DAT2," % n,
+            termination=b"\n\n",
+            allow_empty=True,
+        )
 
-        if response == b"":
+        if waveform is None:  # no data
             return None
 
-        self.adapter.read_termination = "\n"  # restore normal read termination
-        self.adapter.max_attempts = max_attempts
-
-        header, size, waveform = response[:13], response[13:22], response[22:-2]
-        size = int(size)
-
-        # convert bytes to integers
-        waveform = np.array(struct.unpack("b" * size, waveform), dtype=np.float64)
-
         scale = self._get_chn_scale(n)
         pos = self._get_chn_position(n)
 
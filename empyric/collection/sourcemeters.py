@@ -5,6 +5,7 @@ from typing import Union
 import numpy as np
 import pandas as pd
 
+from empyric.tools import resolve_path
 from empyric.types import Toggle, ON, OFF, String, Float, Array
 from empyric.adapters import GPIB
 from empyric.collection.instrument import Instrument, setter, getter, measurer
@@ -17,7 +18,10 @@ class Keithley2400(Instrument):
 
     name = "Keithley2400"
 
-    supported_adapters = ((GPIB, {"delay": 0.1, "timeout": 0.5}),)
+    # the delay knob sets the adapter's fixed delay before reading responses
+    supported_adapters = (
+        (GPIB, {"delay": 0.1, "timeout": 0.5, "fixed_delay": True}),
+    )
 
     # Available knobs
     knobs = (
@@ -343,16 +347,16 @@ class Keithley2400(Instrument):
 
         if isinstance(voltages, str):
             is_csv = ".csv" in voltages.lower()
-            is_file = os.path.isfile(voltages)
+            path = resolve_path(voltages)
 
-            if not is_csv or not is_file:
+            if not is_csv or path is None:
                 raise ValueError(
                     f"invalid fast voltages path for {self.name}; "
                     "a 1D numerical array or valid path to CSV file must be "
                     "provided."
                 )
 
-            voltage_data = pd.read_csv(voltages)
+            voltage_data = pd.read_csv(path)
 
             columns = voltage_data.columns
 
@@ -447,7 +451,8 @@ class Keithley2460(Instrument):
 
     name = "Keithley2460"
 
-    supported_adapters = ((GPIB, {}),)
+    # the delay knob sets the adapter's fixed delay before reading responses
+    supported_adapters = ((GPIB, {"fixed_delay": True}),)
 
     # Available knobs
     knobs = (
@@ -1,4 +1,3 @@
-import time
 import struct
 import numpy as np
 
@@ -42,13 +41,20 @@ class SRSRGA(Instrument):
         # current is in mA
 
         if current >= 3.5:
-            self.query("FL3.5")
+            current = 3.5
         elif current <= 0:
-            self.query("FL0")
+            current = 0
         else:
-            self.query("FL" + f"{np.round(current, 2)}")
+            current = np.round(current, 2)
 
-        time.sleep(5)
+        self.query("FL" + f"{current}")
+
+        # wait for the emission current to settle
+        self.wait_until(
+            lambda: abs(float(self.query("FL?")) - current) < 0.02,
+            timeout=5,
+            interval=0.1,
+        )
 
     @measurer
     def measure_filament_current(self) -> Float:
@@ -27,6 +27,8 @@ class Keithley2260B(Instrument):
 
     meters = ("voltage", "current")
 
+    chained_queries = {"voltage": "MEAS:VOLT?", "current": "MEAS:CURR?"}
+
     @measurer
     def measure_current(self) -> Float:
         def validator(response):
@@ -402,6 +404,8 @@ class MagnaPowerSL1000(Instrument):
 
     meters = ("voltage", "current")
 
+    chained_queries = {"voltage": "MEAS:VOLT?", "current": "MEAS:CURR?"}
+
     @setter
     def set_output(self, state: Toggle):
         if state == ON:
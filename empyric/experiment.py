@@ -27,9 +27,9 @@ from empyric import adapters as _adapters
 from empyric import graphics as _graphics
 from empyric import instruments as _instruments
 from empyric import routines as _routines
-from empyric.adapters import AdapterError
+from empyric.adapters import AdapterError, DeadlineError
 
-from empyric.tools import convert_time, Clock, logger
+from empyric.tools import convert_time, Clock, logger, step_deadline
 from empyric.types import recast, Boolean, Toggle, Integer, Float, ON
 
 
@@ -48,7 +48,11 @@ class Experiment:
     experiment should end (i.e. raise `StopIteration` on subsequent call to `__next__`)
     , and can either be a number, a string of the form "[number] [time unit, e.g.
     seconds, minutes or hours]" or "with routines" to end the experiment after the
-    last routine has ended.
+    last routine has ended. The optional `deadline` argument, in the same format as
+    a time value of `end`, is the maximum time to spend retrieving variable values
+    in each iteration; instrument communications are cut short at the deadline and
+    the values that are not retrieved in time are recorded as None and flagged in
+    a '[name] missed deadline' column.
     """
 
     # Possible statuses of an experiment
@@ -99,6 +103,7 @@ class Experiment:
             variables: dict,
             routines: dict = None,
             end: Union[numbers.Number, str, None] = None,
+            deadline: Union[numbers.Number, str, None] = None,
     ):
         self.variables = variables
         # dict of the form {..., name: variable, ...}
@@ -108,6 +113,15 @@ class Experiment:
         for variable in self.variables.values():
             variable._eval_event = threading.Event()
 
+        # Instruments of knobs and meters, which are notified of each step
+        self.instruments = list(
+            dict.fromkeys(
+                variable.instrument
+                for variable in self.variables.values()
+                if isinstance(variable, (_variables.Knob, _variables.Meter))
+            )
+        )
+
         if routines:
             self.routines = routines
             # dictionary of the form {..., name: (variable_name, routine), ...}
@@ -127,18 +141,50 @@ class Experiment:
         else:
             self.end = np.inf
 
+        # Maximum time to spend retrieving variable values in each step
+        self.deadline = convert_time(deadline) if deadline else None
+
+        # Deadline of the current step as a time.monotonic timestamp
+        self._step_deadline = None
+
         self.clock = Clock()
         self.clock.start()
 
         self.timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
 
+        # Knobs with cached values are flagged in the data as cached or fresh
+        self.cache_flags = {
+            name: name + " cached"
+            for name, variable in self.variables.items()
+            if getattr(variable, "cache_ttl", 0.0) > 0.0
+        }
+
+        # With a step deadline, variables retrieved from instruments or servers
+        # are flagged in the data if they missed the deadline, to tell their
+        # missing values apart from actual None values
+        self.deadline_flags = {
+            name: name + " missed deadline"
+            for name, variable in self.variables.items()
+            if self.deadline
+            and isinstance(
+                variable, (_variables.Knob, _variables.Meter, _variables.Remote)
+            )
+        }
+
+        flags = list(self.cache_flags.values()) + list(self.deadline_flags.values())
+
         self.state = pd.Series(
             name=None,
-            data={**{"Time": None}, **{name: None for name in self.variables}},
+            data={
+                **{"Time": None},
+                **{name: None for name in self.variables},
+                **{flag: None for flag in flags},
+            },
             dtype=object,
         )
         self.data = pd.DataFrame(
-            columns=["Time"] + list(variables.keys()), dtype=object
+            columns=["Time"] + list(variables.keys()) + flags,
+            dtype=object,
         )
 
         self._status = Experiment.READY
@@ -183,9 +229,26 @@ class Experiment:
 
         # Get all variable values if experiment is running or holding
         if self.running or self.holding:
+            # Apply knob writes coalesced during the routine updates or held back
+            # by instrument write intervals
+            self._flush_knobs()
+
             for variable in self.variables.values():
                 variable._eval_event.clear()
 
+            if self.deadline:
+                self._step_deadline = time.monotonic() + self.deadline
+
+            # Spectra of signals are only reused within a step
+            _variables.Expression.clear_spectra()
+
+            # Meters acquired together share one transaction within the step
+            for instrument in self.instruments:
+                instrument.start_step()
+
+            # Chain the queries of meters of instruments that support it
+            prefetching_adapters = self._prefetch_meters()
+
             # Run each measure / get operation in its own thread
             threads = {}
             for name in self.variables:
@@ -203,6 +266,12 @@ class Experiment:
 
             self.status = base_status
 
+            for adapter in prefetching_adapters:
+                adapter.discard_prefetched()
+
+            for instrument in self.instruments:
+                instrument.end_step()
+
             # Append new state to experiment data set
             with warnings.catch_warnings():
                 warnings.simplefilter(action="ignore", category=FutureWarning)
@@ -224,8 +293,10 @@ class Experiment:
         """Retrieve and store a variable value"""
 
         try:
-            if isinstance(self.variables[name], _variables.Expression):
-                for symbol, dependee in self.variables[name].definitions.items():
+            variable = self.variables[name]
+
+            if isinstance(variable, _variables.Expression):
+                for symbol, dependee in variable.definitions.items():
                     if hasattr(dependee, "_eval_event"):
                         logger.debug(
                             f"Expression {name} is waiting for {symbol} to be evaluated"
@@ -233,9 +304,34 @@ class Experiment:
 
                         dependee._eval_event.wait()
 
+            # Gates that are experiment variables are evaluated once per step, in
+            # their own threads, rather than by each gated meter
+            gated = isinstance(variable, _variables.Meter) and hasattr(
+                variable.gate, "_eval_event"
+            )
+
+            if gated:
+                logger.debug(f"Meter {name} is waiting for its gate to be evaluated")
+
+                variable.gate._eval_event.wait()
+
+            missed_deadline = False
+
             try:
-                value = self.variables[name].value
+                with step_deadline(self._step_deadline):
+                    if gated and not variable.gate._value:
+                        variable._value = value = None  # gate is closed
+                    elif gated:
+                        value = variable.measure()
+                    else:
+                        value = variable.value
+
                 logger.info(f"{name} evaluated to {value}")
+            except DeadlineError as deadline_error:
+                value = None
+                logger.warning(f"{name} missed the step deadline: {deadline_error}")
+
+                missed_deadline = True
             except AdapterError as adapter_error:
                 value = None
                 logger.warning(f"Unable to evaluate {name}: {adapter_error}")
@@ -246,6 +342,12 @@ class Experiment:
             self.variables[name]._eval_event.set()
             # unblock threads evaluating dependents
 
+            if name in self.cache_flags:
+                self.state[self.cache_flags[name]] = self.variables[name].cached
+
+            if name in self.deadline_flags:
+                self.state[self.deadline_flags[name]] = missed_deadline
+
             if np.size(value) > 1:  # store array data as CSV files
                 if np.any(value):
                     # only save non-empty arrays
@@ -277,6 +379,57 @@ class Experiment:
             self.terminate()
             raise err
 
+    def _prefetch_meters(self):
+        """
+        Submit the chained queries of meters on each instrument whose adapter has
+        query chaining enabled
+
+        :return: (list) adapters holding prefetched responses
+        """
+
+        chains = {}
+        for variable in self.variables.values():
+            if not isinstance(variable, _variables.Meter):
+                continue
+
+            adapter = variable.instrument.adapter
+            question = variable.instrument.chained_queries.get(variable.meter, None)
+
+            if question is not None and adapter.chain_queries:
+                chains.setdefault(adapter, []).append(question)
+
+        def prefetch(_adapter, questions):
+            try:
+                with step_deadline(self._step_deadline):
+                    _adapter.prefetch(questions)
+            except AdapterError as adapter_error:
+                logger.warning(
+                    f"Unable to prefetch queries for {_adapter.instrument.name}: "
+                    f"{adapter_error}"
+                )
+
+        threads = []
+        for adapter, questions in chains.items():
+            threads.append(threading.Thread(target=prefetch, args=(adapter, questions)))
+            threads[-1].start()
+
+        for thread in threads:
+            thread.join()
+
+        return list(chains)
+
+    def _flush_knobs(self):
+        """Write any pending knob values to their instruments"""
+
+        threads = []
+        for name, variable in self.variables.items():
+            if isinstance(variable, _variables.Knob) and variable.pending is not None:
+                threads.append(threading.Thread(target=variable.flush))
+                threads[-1].start()
+
+        for thread in threads:
+            thread.join()
+
     def save(self, directory=None):
         """
         Save the experiment dataframe to a CSV file
@@ -421,6 +574,8 @@ class AsyncExperiment(Experiment):
 
         logger.info(f'Iterating experiment (t = {self.state["Time"]} s)')
 
+        _variables.Expression.clear_spectra()
+
         # End the experiment, if the duration of the experiment has passed
         if self.clock.time > self.end:
             self.terminate()
@@ -460,6 +615,7 @@ class AsyncExperiment(Experiment):
                 self.state.name = datetime.datetime.now()
 
                 await asyncio.to_thread(Experiment._update_routine, self, name)
+                await asyncio.to_thread(self._flush_knobs)
 
             else:
                 await asyncio.sleep(0.1)  # give other updating tasks a chance to run
@@ -871,6 +1027,7 @@ def convert_runcard(runcard):
                 gate=gate,
                 multiplier=specs.get("multiplier", 1),
                 offset=specs.get("offset", 0),
+                calibration=specs.get("calibration", None),
             )
         elif "knob" in specs:
             instrument = converted_runcard["Instruments"][specs["instrument"]]
@@ -881,6 +1038,10 @@ def convert_runcard(runcard):
                 upper_limit=specs.get("upper limit", None),
                 multiplier=specs.get("multiplier", 1),
                 offset=specs.get("offset", 0),
+                calibration=specs.get("calibration", None),
+                cache=specs.get("cache", "always"),
+                deadband=specs.get("deadband", None),
+                coalesce=specs.get("coalesce", False),
             )
         elif "expression" in specs:
             expression = specs["expression"]
@@ -913,6 +1074,7 @@ def convert_runcard(runcard):
                 settable=settable,
                 multiplier=specs.get("multiplier", 1),
                 offset=specs.get("offset", 0),
+                subscribe=specs.get("subscribe", False),
             )
 
         elif "parameter" in specs:
@@ -1005,7 +1167,10 @@ def convert_runcard(runcard):
         logger.info("Initializing asynchronous experiment")
 
         converted_runcard["Experiment"] = Experiment(
-            variables, routines=routines, end=runcard["Settings"].get("end", None)
+            variables,
+            routines=routines,
+            end=runcard["Settings"].get("end", None),
+            deadline=runcard["Settings"].get("step deadline", None),
         )
 
     # Alarms section
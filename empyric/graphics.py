@@ -618,6 +618,35 @@ class ExperimentGUI:
                 row=i, column=0, sticky=tk.E
             )
 
+        # Table of instrument indicators shows the state of communications with
+        # each instrument (see the chaperone function in the adapters module)
+        self.instrument_status_labels = {}
+
+        if len(self.instruments) > 0:
+            i += 1
+            tk.Label(
+                self.status_frame, text="Instruments", font=("Arial", 14, "bold")
+            ).grid(row=i, column=1)
+
+            i += 1
+            for name in self.instruments:
+                tk.Label(
+                    self.status_frame, text=name, width=len(name), anchor=tk.E
+                ).grid(row=i, column=0, sticky=tk.E)
+
+                self.instrument_status_labels[name] = tk.Label(
+                    self.status_frame, text="OK", relief=tk.SUNKEN, width=30
+                )
+                self.instrument_status_labels[name].grid(
+                    row=i, column=1, sticky=tk.W, padx=10
+                )
+
+                i += 1
+
+            tk.Label(self.status_frame, text="", font=("Arial", 14, "bold")).grid(
+                row=i, column=0, sticky=tk.E
+            )
+
         # Servers
         self.servers = {
             name: routine
@@ -759,6 +788,19 @@ class ExperimentGUI:
             else:
                 label.config(text="CLEAR", bg="green")
 
+        # Check instrument communications
+        for name, label in self.instrument_status_labels.items():
+            breaker_state = getattr(
+                self.instruments[name].adapter, "breaker_state", "closed"
+            )
+
+            if breaker_state == "open":
+                label.config(text="UNRESPONSIVE: RECONNECTING", bg="red")
+            elif breaker_state == "half-open":
+                label.config(text="RECONNECTED: ON TRIAL", bg="yellow")
+            else:
+                label.config(text="OK", bg="green")
+
         # Update hold, stop and dashboard buttons
         if self.experiment.holding or self.experiment.stopped:
             self.dash_button.config(state=tk.NORMAL)
@@ -9,7 +9,6 @@ from typing import Union
 import select
 import functools
 
-import dill
 import numpy as np
 import pandas as pd
 from scipy.optimize import minimize as scipy_minimize
@@ -20,13 +19,16 @@ from bayes_opt import BayesianOptimization, UtilityFunction
 from empyric.tools import (
     convert_time,
     autobind_socket,
-    read_from_socket,
+    SocketReader,
     write_to_socket,
     get_ip_address,
     logger,
+    push_marker,
+    array_frame,
 )
 from empyric.types import (
     recast,
+    infer_type,
     Boolean,
     Integer,
     Float,
@@ -36,7 +38,6 @@ from empyric.types import (
     Array,
     String,
 )
-from empyric.types import supported as supported_types
 
 
 class Routine:
@@ -876,6 +877,9 @@ class SocketServer(Routine):
     Any knobs given in the `knobs` argument can be read and set by clients.
     Clients can also read the values of any variables of the controlling
     experiment, via the `state` argument of the `update` method.
+
+    Clients can subscribe to any of these values, in which case the server pushes
+    the value to the client whenever it changes upon an update.
     """
 
     assert_control = False
@@ -899,6 +903,18 @@ class SocketServer(Routine):
         self.running = True
 
         self.state = {}
+        self._state_count = 0  # number of state updates
+
+        # for each client address, the subscribed aliases and the last value
+        # response pushed for each, and the state count at the last push
+        self.subscriptions = {}
+        self._pushed_counts = {}
+
+        # buffered reader of requests from each client address
+        self._readers = {}
+
+        # for each alias, the path to the CSV file last read and the array therein
+        self._csv_arrays = {}
 
         self.server_thread = threading.Thread(
             target=asyncio.run, args=(self._run_async_server(),)
@@ -923,18 +939,22 @@ class SocketServer(Routine):
 
     async def _accept_connections(self):
         if self.running:
+            # Accept only pending connections, so as not to delay requests
+            pending = self.socket in select.select([self.socket], [], [], 0)[0]
+
             try:
-                (client, address) = self.socket.accept()
+                if pending:
+                    (client, address) = self.socket.accept()
 
-                client.settimeout(1)
+                    client.settimeout(1)
 
-                clients = self.clients_queue.get()
+                    clients = self.clients_queue.get()
 
-                clients[address] = client
+                    clients[address] = client
 
-                self.clients_queue.put(clients)
+                    self.clients_queue.put(clients)
 
-                print(f"Client at {address} has connected")
+                    print(f"Client at {address} has connected")
 
             except socket.timeout:
                 pass
@@ -978,11 +998,30 @@ class SocketServer(Routine):
                 if client is not None
             }
 
+            # Wait briefly for requests from any client
+            if clients:
+                readable = select.select(list(clients.values()), [], [], 0.05)[0]
+            else:
+                readable = []
+
             for address, client in clients.items():
-                outgoing_message = None
+                reader = self._readers.get(address)
+
+                if reader is None or reader.socket is not client:
+                    reader = self._readers[address] = SocketReader(client)
 
                 try:
-                    request = read_from_socket(client, chunk_size=1)
+                    # Push changed values of subscribed variables
+                    for outgoing_message in self._pushes(address):
+                        write_to_socket(client, outgoing_message)
+
+                    # Requests may also be left in the reader's buffer, if a client
+                    # sent several requests in succession
+                    if client in readable or reader.buffered:
+                        request = reader.read()
+                    else:
+                        request = None
+
                 except ConnectionError:
                     print(f"Connection issue with client at {address}")
                     client.shutdown(socket.SHUT_RDWR)
@@ -994,87 +1033,27 @@ class SocketServer(Routine):
                     alias = " ".join(request.split(" ")[:-1])
                     value = request.split(" ")[-1]
 
-                    if alias not in self.knobs and alias not in self.state:
-                        outgoing_message = f"Error: invalid alias"
-
-                    elif value == "settable?":
-                        settable = (alias in self.knobs) and self.knobs[alias].settable
-
-                        if settable:
-                            outgoing_message = f"{alias} settable"
-                        elif alias in self.state:
-                            outgoing_message = f"{alias} read-only"
-                        else:
-                            outgoing_message = f"{alias} undefined"
-
-                    elif value == "type?":
-                        if alias in self.knobs:
-                            _type = self.knobs[alias]._type
-                        elif alias in self.state:
-                            _type = None
-                            value = self.state[alias]
-
-                            if isinstance(value, String) and ".csv" in value:
-                                # value is an Array stored in a CSV file
-                                _type = Array
-                            else:
-                                for supported_type in supported_types.values():
-                                    if isinstance(value, supported_type):
-                                        _type = supported_type
-
-                        else:
-                            _type = None
-
-                        outgoing_message = f"{alias} {_type}"
-
-                    elif value == "?":  # Query of value
-                        if alias in self.knobs:
-                            _value = self.knobs[alias].value
-                        elif alias in self.state:
-                            _value = self.state[alias]
-
-                            if isinstance(_value, String) and ".csv" in _value:
-                                # value is an array, list or tuple stored in CSV file
-                                df = pd.read_csv(_value)
-
-                                if alias in df.columns:
-                                    # 1D array
-                                    _value = df[alias].values
-                                else:
-                                    # 2D array
-                                    _value = df.values
-
-                        else:
-                            _value = None
-
-                        if isinstance(_value, Array):
-                            # pickle arrays and send as bytes
-                            outgoing_message = f"{alias} dlpkl".encode()
-                            outgoing_message += dill.dumps(
-                                _value, protocol=dill.HIGHEST_PROTOCOL
-                            )
-                        else:
-                            outgoing_message = f"{alias} {_value}"
-
-                    else:  # Setting a value
-                        knob_exists = alias in self.knobs
-
-                        is_free = not getattr(self.knobs[alias], "_controller", None)
+                    if value == "subscribe":
+                        outgoing_messages = [self._subscribe(address, alias)]
 
-                        if knob_exists and is_free:
-                            knob = self.knobs[alias]
+                    elif value == "unsubscribe":  # no response is sent
+                        self.subscriptions.get(address, {}).pop(alias, None)
+                        outgoing_messages = []
 
-                            knob.value = recast(value, to=knob._type)
+                    elif "\t" in alias and value == "?":
+                        # Multi-get; a header giving the number of values is sent
+                        # first, followed by a response for each alias
+                        aliases = alias.split("\t")
 
-                            outgoing_message = f"{alias} {knob.value}"
-
-                        else:
-                            outgoing_message = f"Error: cannot set {alias}"
+                        outgoing_messages = [f"{len(aliases)} values"] + [
+                            self._respond(_alias, value) for _alias in aliases
+                        ]
+                    else:
+                        outgoing_messages = [self._respond(alias, value)]
 
-                # Send outgoing message
-                if outgoing_message is not None:
-                    write_to_socket(client, outgoing_message)
-                    message_sent = True
+                    # Send outgoing messages
+                    for outgoing_message in outgoing_messages:
+                        write_to_socket(client, outgoing_message)
 
                 # Remove clients with problematic connections
                 exceptional = client in select.select([], [], [client], 0)[2]
@@ -1083,14 +1062,177 @@ class SocketServer(Routine):
                     print(f"Client at {address} has a connection issue")
                     clients[address] = None
 
+            for address, client in clients.items():
+                if client is None:
+                    self.subscriptions.pop(address, None)
+                    self._pushed_counts.pop(address, None)
+                    self._readers.pop(address, None)
+
             self.clients_queue.put(clients)
             await asyncio.sleep(0.001)
 
             asyncio.create_task(self._process_requests())
 
+    def _respond(self, alias, value):
+        """
+        Get the response to a request from a client
+
+        :param alias: (str) alias of the variable
+        :param value: (str) '?', 'settable?' or 'type?' for queries, or the value to
+                      set the variable to
+        :return: (str/bytes) response message
+        """
+
+        if alias not in self.knobs and alias not in self.state:
+            return f"Error: invalid alias"
+
+        elif value == "settable?":
+            settable = (alias in self.knobs) and self.knobs[alias].settable
+
+            if settable:
+                return f"{alias} settable"
+            elif alias in self.state:
+                return f"{alias} read-only"
+            else:
+                return f"{alias} undefined"
+
+        elif value == "type?":
+            if alias in self.knobs:
+                _type = self.knobs[alias]._type
+            elif alias in self.state:
+                _type = None
+                value = self.state[alias]
+
+                if isinstance(value, String) and ".csv" in value:
+                    # value is an Array stored in a CSV file
+                    _type = Array
+                else:
+                    _type = infer_type(value)
+
+            else:
+                _type = None
+
+            return f"{alias} {_type}"
+
+        elif value == "?":  # Query of value
+            if alias in self.knobs:
+                _value = self.knobs[alias].value
+            elif alias in self.state:
+                _value = self.state[alias]
+            else:
+                _value = None
+
+            return self._value_response(alias, _value)
+
+        else:  # Setting a value
+            knob_exists = alias in self.knobs
+
+            is_free = not getattr(self.knobs[alias], "_controller", None)
+
+            if knob_exists and is_free:
+                knob = self.knobs[alias]
+
+                knob.value = recast(value, to=knob._type)
+
+                return f"{alias} {knob.value}"
+
+            else:
+                return f"Error: cannot set {alias}"
+
+    def _value_response(self, alias, value):
+        """
+        Get the response to a value query
+
+        :param alias: (str) alias of the variable
+        :param value: value of the variable
+        :return: (str/bytes) response message
+        """
+
+        if isinstance(value, String) and ".csv" in value:
+            # value is an array, list or tuple stored in CSV file, which is read
+            # only once
+            path, array = self._csv_arrays.get(alias, (None, None))
+
+            if path != value:
+                df = pd.read_csv(value)
+
+                if alias in df.columns:
+                    # 1D array
+                    array = df[alias].values
+                else:
+                    # 2D array
+                    array = df.values
+
+                self._csv_arrays[alias] = (value, array)
+
+            value = array
+
+        if isinstance(value, Array):
+            # send arrays as binary frames
+            return array_frame(alias, value)
+        else:
+            return f"{alias} {value}"
+
+    def _subscribe(self, address, alias):
+        """
+        Subscribe a client to pushed values of a variable
+
+        :param address: (tuple) address of the client
+        :param alias: (str) alias of the variable
+        :return: (str) response message
+        """
+
+        if alias not in self.knobs and alias not in self.state:
+            return f"Error: invalid alias"
+
+        else:
+            subscriptions = self.subscriptions.setdefault(address, {})
+            subscriptions[alias] = None  # current value is pushed on the next pass
+            self._pushed_counts[address] = None
+            return f"{alias} subscribed"
+
+    def _pushes(self, address):
+        """
+        Get the messages pushing values of subscribed variables to a client that
+        have changed since the last push
+
+        :param address: (tuple) address of the client
+        :return: (list) push messages
+        """
+
+        subscriptions = self.subscriptions.get(address, {})
+
+        if not subscriptions or self._pushed_counts.get(address) == self._state_count:
+            return []
+
+        self._pushed_counts[address] = self._state_count
+
+        messages = []
+
+        for alias, last_response in subscriptions.items():
+            if alias in self.state:
+                value = self.state[alias]
+            elif alias in self.knobs:
+                value = self.knobs[alias]._value
+            else:
+                continue
+
+            response = self._value_response(alias, value)
+
+            if response != last_response:
+                subscriptions[alias] = response
+
+                if isinstance(response, str):
+                    response = response.encode()
+
+                messages.append(push_marker + alias.encode() + b"\t" + response)
+
+        return messages
+
     @Routine.enabler
     def update(self, state):
         self.state = state
+        self._state_count += 1
 
     def __del__(self):
         if self.running:
@@ -1342,10 +1484,7 @@ class ModbusServer(Routine):
 
             for i, (name, value) in enumerate(selection.items()):
 
-                _type = None
-                for supported_type in supported_types.values():
-                    if isinstance(value, supported_type):
-                        _type = supported_type
+                _type = infer_type(value)
 
                 builder = self._payload_builder(byteorder=">")
 
@@ -32,3 +32,328 @@ def test_phidget():
     Phidget = importlib.import_module("empyric.adapters").Phidget
 
     assert Phidget.lib is not None
+
+
+def test_prefetch():
+    adapters = importlib.import_module("empyric.adapters")
+    instrument = importlib.import_module("empyric.collection.instrument")
+
+    class ChainingAdapter(adapters.Adapter):
+        queries = []
+
+        def _query(self, question):
+            self.queries.append(question)
+            return ";".join(str(i) for i, _ in enumerate(question.split(";:")))
+
+    class ChainingInstrument(instrument.Instrument):
+        supported_adapters = ((ChainingAdapter, {}),)
+
+    chaining_instrument = ChainingInstrument()
+    adapter = chaining_instrument.adapter
+
+    adapter.prefetch(["MEAS:VOLT?", "MEAS:CURR?"])
+
+    assert adapter.queries == ["MEAS:VOLT?;:MEAS:CURR?"]
+    assert adapter.query("MEAS:CURR?") == "1"
+    assert adapter.query("MEAS:VOLT?") == "0"
+    assert len(adapter.queries) == 1
+
+    assert adapter.query("MEAS:VOLT?") == "0"  # prefetched response was used up
+    assert len(adapter.queries) == 2
+
+
+def test_query_block():
+    np = importlib.import_module("numpy")
+    adapters = importlib.import_module("empyric.adapters")
+    instrument = importlib.import_module("empyric.collection.instrument")
+
+    data = np.arange(-500, 500, dtype="<i2")
+
+    class BlockAdapter(adapters.Adapter):
+        response = None
+
+        def _write(self, message):
+            block = data.tobytes()
+            header = b"#%d%d" % (len(str(len(block))), len(block))
+
+            self.response = memoryview(b"CH1:" + header + block + b"\n")
+
+        def _read_into(self, buffer):
+            if len(self.response) < len(buffer):
+                raise TimeoutError("no response")
+
+            buffer[:] = self.response[: len(buffer)]
+            self.response = self.response[len(buffer) :]
+
+    class BlockInstrument(instrument.Instrument):
+        supported_adapters = ((BlockAdapter, {}),)
+
+    adapter = BlockInstrument().adapter
+
+    block = adapter.query_block("CH1?", dtype="<i2", prefix=b"CH1:", termination=b"\n")
+
+    assert np.array_equal(block, data)
+    assert len(adapter.response) == 0
+
+    # a fixed delay is waited before reading the block, as for other queries
+    time = importlib.import_module("time")
+
+    adapter.fixed_delay = True
+    adapter.delay = 0.05
+
+    start = time.perf_counter()
+    block = adapter.query_block("CH1?", dtype="<i2", prefix=b"CH1:", termination=b"\n")
+
+    assert np.array_equal(block, data)
+    assert time.perf_counter() - start >= 0.05
+
+    adapter.fixed_delay = False
+
+    # no response at all, e.g. if the instrument has no data
+    assert adapter._read_block(allow_empty=True) is None
+
+    adapter.response = memoryview(b"#0\x01\x02\n")
+
+    try:
+        adapter._read_block()
+        raise AssertionError("indefinite length block was not rejected")
+    except ValueError:
+        pass
+
+
+def test_wait_for_response():
+    time = importlib.import_module("time")
+    adapters = importlib.import_module("empyric.adapters")
+    instrument = importlib.import_module("empyric.collection.instrument")
+
+    class WaitingAdapter(adapters.Adapter):
+        delay = 1.0
+
+        def _query(self, question):
+            sent = time.perf_counter()
+            self._wait_for_response(ready=lambda: time.perf_counter() > sent + 0.01)
+            return question
+
+    class WaitingInstrument(instrument.Instrument):
+        supported_adapters = ((WaitingAdapter, {}),)
+
+    adapter = WaitingInstrument().adapter
+
+    adapter.query("ready?")
+
+    assert adapter.response_time_stats["count"] == 1
+    assert 0.01 < adapter.response_time_stats["max"] < 0.5  # not the full delay
+
+    adapter.fixed_delay = True
+    adapter.delay = 0.1
+
+    adapter.query("ready?")
+
+    assert adapter.response_time_stats["max"] >= 0.1
+
+
+def test_circuit_breaker():
+    time = importlib.import_module("time")
+    adapters = importlib.import_module("empyric.adapters")
+    instrument = importlib.import_module("empyric.collection.instrument")
+
+    class FlakyAdapter(adapters.Adapter):
+        responsive = False
+        reconnect_interval = 0.01
+
+        def _query(self, question):
+            if not self.responsive:
+                raise TimeoutError("no response")
+            return question
+
+    class FlakyInstrument(instrument.Instrument):
+        supported_adapters = ((FlakyAdapter, {}),)
+
+    adapter = FlakyInstrument().adapter
+
+    for _ in range(adapter.failure_threshold):
+        try:
+            adapter.query("?")
+        except adapters.AdapterError:
+            pass
+
+    assert adapter.breaker_state == "open"
+
+    start = time.perf_counter()
+
+    try:
+        adapter.query("?")  # fails fast
+    except adapters.AdapterError:
+        pass
+
+    assert time.perf_counter() - start < 0.01
+
+    # breaker is half-open once reconnected in the background
+    for _ in range(100):
+        if adapter.breaker_state != "open":
+            break
+        time.sleep(0.01)
+
+    adapter.responsive = True
+
+    assert adapter.query("?") == "?"
+    assert adapter.breaker_state == "closed"
+
+    # no reconnection attempts once the instrument is intentionally disconnected
+    adapter.instrument.disconnect()
+    adapter.responsive = False
+
+    for _ in range(adapter.failure_threshold):
+        try:
+            adapter.query("?")
+        except adapters.AdapterError:
+            pass
+
+    time.sleep(0.05)
+
+    assert adapter.breaker_state == "open"
+
+
+def test_modbus_prefetch():
+    adapters = importlib.import_module("empyric.adapters")
+    instrument = importlib.import_module("empyric.collection.instrument")
+
+    class Response:
+        def __init__(self, registers):
+            self.registers = registers
+
+    class Client:
+        connected = True
+        requests = []
+
+        read_coils = read_discrete_inputs = read_holding_registers = None
+
+        def read_input_registers(self, address, count=1, slave=0):
+            self.requests.append((address, count))
+            return Response(list(range(address, address + count)))
+
+        def close(self):
+            self.connected = False
+
+    class FakeModbus(adapters.Modbus):
+        def connect(self):
+            self.backend = Client()
+
+    class Device(instrument.Instrument):
+        supported_adapters = ((FakeModbus, {}),)
+
+    adapter = Device().adapter
+
+    adapter.prefetch([(4, 4, 2), (4, 0, 2), (4, 2, 2), (4, 10, 1), (4, 0, 2)])
+
+    # contiguous ranges are merged; the isolated one is read on demand
+    assert adapter.backend.requests == [(0, 6)]
+
+    assert adapter.read(4, 0, count=2, _type=None) == [0, 1]
+    assert adapter.read(4, 4, count=2, _type=None) == [4, 5]
+    assert adapter.read(4, 2, count=2, _type="32bit_uint") == 2 * 2**16 + 3
+    assert adapter.read(4, 10) == 10
+    assert adapter.backend.requests == [(0, 6), (10, 1)]
+
+    # reads are split at the maximum read count
+    adapter.max_read_count = 4
+    reads = adapter._plan_reads([(4, 0, 2), (4, 2, 1), (4, 3, 2)])
+
+    assert [read[:3] for read in reads] == [[4, 0, 3], [4, 3, 2]]
+
+
+def test_modbus_payload():
+    np = importlib.import_module("numpy")
+    adapters = importlib.import_module("empyric.adapters")
+    payload = importlib.import_module("pymodbus.payload")
+
+    adapter = adapters.Modbus.__new__(adapters.Modbus)
+
+    registers = np.random.default_rng(0).integers(0, 2**16, 24).tolist()
+
+    for adapter.byte_order in "<>":
+        for adapter.word_order in "<>":
+            for _type in ["8bit_int", "16bit_uint", "32bit_float", "64bit_int"]:
+                count = 24 * 16 // int(_type.split("bit")[0])
+
+                decoder = payload.BinaryPayloadDecoder.fromRegisters(
+                    registers,
+                    byteorder=adapter.byte_order,
+                    wordorder=adapter.word_order,
+                )
+
+                decode = getattr(decoder, "decode_" + _type)
+                values = [decode() for _ in range(count)]
+
+                assert adapter._decode(registers, _type, count) == values
+                assert adapter._encode(np.array(values), _type) == registers
+
+
+def test_modbus_serial_bus():
+    time = importlib.import_module("time")
+    threading = importlib.import_module("threading")
+    adapters = importlib.import_module("empyric.adapters")
+
+    bus = adapters._ModbusSerialBus(19200)
+
+    order = []
+
+    def transact(slave_id):
+        with bus.transaction(slave_id):
+            order.append(slave_id)
+
+    threads = [threading.Thread(target=transact, args=(i,)) for i in [1, 1, 1, 2, 2]]
+
+    with bus.transaction(0):  # hold the bus while transactions queue up
+        for thread in threads:
+            thread.start()
+            time.sleep(0.01)
+
+        assert bus.busy
+
+    for thread in threads:
+        thread.join()
+
+    # slaves with pending transactions take turns
+    assert order == [1, 2, 1, 2, 1]
+    assert not bus.busy
+
+
+def test_deadline_timeout_cap():
+    time = importlib.import_module("time")
+    tools = importlib.import_module("empyric.tools")
+    adapters = importlib.import_module("empyric.adapters")
+    instrument = importlib.import_module("empyric.collection.instrument")
+
+    class CappedAdapter(adapters.Adapter):
+        timeout = 5
+
+        def _query(self, question):
+            return self.timeout
+
+    class BrokenAdapter(CappedAdapter):
+        @property
+        def timeout(self):
+            return 5
+
+        @timeout.setter
+        def timeout(self, timeout):
+            raise TypeError("invalid timeout")
+
+    class Device(instrument.Instrument):
+        supported_adapters = ((CappedAdapter, {}),)
+
+    adapter = Device().adapter
+    broken = Device(adapter=BrokenAdapter).adapter
+
+    with tools.step_deadline(time.monotonic() + 1):
+        assert adapter.query("?") <= 1
+
+        try:
+            broken.query("?")
+        except TypeError:
+            pass
+
+    # the timeout is restored and the lock is released in any case
+    assert adapter.timeout == 5
+    assert not broken.lock.locked()
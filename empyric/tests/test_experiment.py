@@ -3,10 +3,13 @@
 import os
 import time
 import glob
+import threading
 from empyric.variables import Knob, Meter
 from empyric.experiment import Experiment, validate_runcard, Manager
 from empyric.routines import Timecourse
-from empyric.instruments import Echo
+from empyric.instruments import Echo, Instrument, measurer, acquisition
+from empyric.types import Float
+from empyric.adapters import Adapter
 
 
 def test_experiment(tmp_path):
@@ -48,6 +51,99 @@ def test_experiment(tmp_path):
     assert any(glob.glob("data_*.csv"))
 
 
+def test_gated_meters(tmp_path):
+    """
+    Test that a gate shared by several meters is evaluated once per step
+    """
+
+    os.chdir(str(tmp_path))
+
+    echo = Echo()
+    gate_echo = Echo()
+
+    gate_measurements = []
+
+    def measure_gate():
+        gate_measurements.append(gate_echo.input)
+        return gate_echo.input
+
+    gate_echo.measure_output = measure_gate
+
+    gate = Meter(instrument=gate_echo, meter="output")
+
+    variables = {
+        "Gate": gate,
+        "Echo Out 1": Meter(instrument=echo, meter="output", gate=gate),
+        "Echo Out 2": Meter(instrument=echo, meter="output", gate=gate),
+    }
+
+    experiment = Experiment(variables)
+
+    state = next(experiment)  # gate is closed
+
+    assert len(gate_measurements) == 1
+    assert state["Echo Out 1"] is None and state["Echo Out 2"] is None
+
+    gate_echo.set("input", 1)
+
+    state = next(experiment)  # gate is open
+
+    assert len(gate_measurements) == 2
+    assert state["Echo Out 1"] == 0 and state["Echo Out 2"] == 0
+
+    experiment.terminate()
+
+
+def test_shared_acquisitions(tmp_path):
+    """
+    Test that meters acquired together share one transaction per step
+    """
+
+    os.chdir(str(tmp_path))
+
+    class Vector(Instrument):
+        meters = ("x", "y")
+
+        acquisitions = 0
+
+        @acquisition
+        def _measure_vector(self):
+            self.acquisitions += 1
+            return [1.0, 2.0]
+
+        @measurer
+        def measure_x(self) -> Float:
+            return self._measure_vector()[0]
+
+        @measurer
+        def measure_y(self) -> Float:
+            return self._measure_vector()[1]
+
+    vector = Vector()
+
+    variables = {
+        "x": Meter(instrument=vector, meter="x"),
+        "y": Meter(instrument=vector, meter="y"),
+    }
+
+    experiment = Experiment(variables)
+
+    state = next(experiment)
+
+    assert state["x"] == 1.0 and state["y"] == 2.0
+    assert vector.acquisitions == 1
+
+    next(experiment)
+
+    assert vector.acquisitions == 2
+
+    # outside of steps, each call communicates with the instrument
+    vector.measure_x()
+    assert vector.acquisitions == 3
+
+    experiment.terminate()
+
+
 # Use Henon runcard example for testing
 tests_dir = os.path.dirname(__file__)
 
@@ -82,3 +178,86 @@ def test_manager(tmp_path):
     manager.run(directory=tmp_path)
 
     assert manager.experiment.terminated
+
+
+def test_wait_until():
+    """
+    Test that waiting for an instrument releases it to other threads
+    """
+
+    class Slow(Instrument):
+        meters = ("done", "other")
+
+        finished = False
+
+        @measurer
+        def measure_done(self) -> Float:
+            completed = self.wait_until(lambda: self.finished, timeout=5)
+            return float(completed)
+
+        @measurer
+        def measure_other(self) -> Float:
+            self.finished = True  # only possible if the lock was released
+            return 1.0
+
+    slow = Slow()
+
+    waiting = threading.Thread(target=slow.measure_done)
+    waiting.start()
+
+    time.sleep(0.1)
+
+    assert slow.measure_other() == 1.0
+
+    waiting.join()
+
+    assert slow.done == 1.0
+    assert not Slow().wait_until(lambda: False, timeout=0.05)
+
+
+def test_step_deadline(tmp_path):
+    """
+    Test that instrument communications are cut short at the step deadline
+    """
+
+    os.chdir(str(tmp_path))
+
+    class SilentAdapter(Adapter):
+        timeout = 5
+
+        def _query(self, question):
+            time.sleep(self.timeout)  # waits for a response that never comes
+            raise TimeoutError("no response")
+
+    class Silent(Instrument):
+        supported_adapters = ((SilentAdapter, {}),)
+
+        meters = ("reading",)
+
+        @measurer
+        def measure_reading(self) -> Float:
+            return float(self.query("READ?"))
+
+    silent = Silent()
+
+    variables = {
+        "Reading": Meter(instrument=silent, meter="reading"),
+        "Echo Out": Meter(instrument=Echo(), meter="output"),
+    }
+
+    experiment = Experiment(variables, deadline=0.2)
+
+    start = time.perf_counter()
+    state = next(experiment)
+
+    assert time.perf_counter() - start < 1
+    assert state["Reading"] is None and state["Echo Out"] == 0
+
+    # the missing value is flagged as such in the data
+    assert state["Reading missed deadline"] is True
+    assert state["Echo Out missed deadline"] is False
+
+    # the adapter's own timeout applies again outside of steps
+    assert silent.adapter.timeout == 5
+
+    experiment.terminate()
@@ -0,0 +1,76 @@
+# Tests for tools
+
+import time
+import socket
+import threading
+
+from empyric.tools import read_from_socket, SocketReader
+
+
+def test_read_from_socket():
+    """
+    Test tools.read_from_socket, including the time taken to read a large message
+    over a local socket pair
+    """
+
+    socket_a, socket_b = socket.socketpair()
+
+    socket_b.sendall(b"hello\rworld\r")
+
+    assert read_from_socket(socket_a, timeout=1) == "hello\rworld"
+
+    socket_b.sendall(b"abcdef")
+
+    assert read_from_socket(socket_a, nbytes=4, timeout=1) == "abcd"
+    assert read_from_socket(socket_a, termination=b"ef", timeout=1) == "ef"
+
+    # Large message; reading time should scale linearly with message size
+    message = b"0123456789abcdef" * 2**20 + b"\r"  # 16 MB
+
+    sender = threading.Thread(target=socket_b.sendall, args=(message,))
+    sender.start()
+
+    start = time.perf_counter()
+    received = read_from_socket(socket_a, timeout=5, decode=False)
+    elapsed = time.perf_counter() - start
+
+    sender.join()
+
+    socket_a.close()
+    socket_b.close()
+
+    assert received == message
+    assert elapsed < 5  # about 0.1 s, compared to 30 s for a quadratic read
+
+
+def test_socket_reader():
+    """
+    Test tools.SocketReader, which keeps bytes received after each message for the
+    next read
+    """
+
+    socket_a, socket_b = socket.socketpair()
+
+    reader = SocketReader(socket_a)
+
+    socket_b.sendall(b"first\rsecond\r0123456789")
+
+    assert reader.read(timeout=1) == "first"
+    assert reader.read(timeout=1, decode=False) == b"second\r"
+    assert reader.read(nbytes=4, timeout=1) == "0123"
+
+    data = bytearray(8)
+
+    socket_b.sendall(b"abcd")
+    reader.read_into(data, timeout=1)
+
+    assert data == b"456789ab"
+    assert reader.read(nbytes=2, timeout=1) == "cd"
+    assert reader.buffered == 0
+
+    # a zero timeout does not wait for more bytes
+    assert reader.read(timeout=0) == ""
+    assert read_from_socket(socket_a, timeout=0) == ""
+
+    socket_a.close()
+    socket_b.close()
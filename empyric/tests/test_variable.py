@@ -1,5 +1,16 @@
-from empyric.instruments import Clock
-from empyric.variables import Knob, Meter, Parameter, Expression
+import socket
+import threading
+import time
+
+import numpy as np
+
+from empyric.instruments import Clock, Echo
+from empyric.types import ON
+from empyric.routines import SocketServer
+from empyric.adapters import DeadlineError
+from empyric.tools import SocketReader, write_to_socket, step_deadline
+from empyric.variables import Knob, Meter, Parameter, Expression, Remote
+from empyric.variables import _SocketConnection
 
 
 def test_variable():
@@ -24,3 +35,263 @@ def test_variable():
     assert test_meter.value == 0
     assert test_parameter.value == 5
     assert test_expression.value == 5
+
+
+def test_expression_spectra():
+    """
+    Test that spectral functions of expressions share transforms of a signal
+    """
+
+    t = np.arange(1000) * 1e-3
+    signal = Parameter(parameter=np.sin(2 * np.pi * 50 * t))
+    dt = Parameter(parameter=1e-3)
+
+    definitions = {"s": signal, "dt": dt}
+
+    Expression.clear_spectra()
+
+    carrier = Expression(expression="carrier(s, dt)", definitions=definitions)
+    amplitude = Expression(expression="ampl(s, dt)", definitions=definitions)
+
+    assert carrier.value == 50.0
+    assert np.isclose(amplitude.value, 1.0)
+    assert len(Expression._spectra) == 1
+
+    Expression.clear_spectra()
+
+    assert len(Expression._spectra) == 0
+
+
+def test_demod_short_signal():
+    """
+    Test demodulation of a signal shorter than one partition
+    """
+
+    t = np.arange(100) * 1e-3
+    signal = np.sin(2 * np.pi * 50 * t)
+
+    Expression.clear_spectra()
+
+    demodulated = Expression.demod(signal, 1e-3, 50, bw=40, cycles=10)
+
+    assert demodulated.shape == (200,)
+
+    Expression.clear_spectra()
+
+
+def test_knob_cache():
+    """
+    Test cache policies of knobs
+    """
+
+    echo = Echo()
+
+    always = Knob(instrument=echo, knob="connected")
+    on_write = Knob(instrument=echo, knob="connected", cache="on-write")
+
+    assert always.value == ON and not always.cached
+    assert always.value == ON and not always.cached
+
+    assert on_write.value == ON and not on_write.cached
+    assert on_write.value == ON and on_write.cached
+
+
+def test_knob_write_coalescing():
+    """
+    Test deadband, coalescing and rate limiting of knob writes
+    """
+
+    echo = Echo()
+
+    knob = Knob(instrument=echo, knob="input", deadband=0.5, coalesce=True)
+
+    knob.value = 1.0
+    knob.value = 2.0
+
+    assert knob.pending == 2.0 and echo.input == 0
+    assert knob.flush() and echo.input == 2.0 and knob.pending is None
+
+    knob.value = 2.25  # within deadband
+    assert knob.pending is None
+
+    echo.adapter.write_interval = 60
+    knob.coalesce = False
+
+    knob.value = 3.0  # held by write interval
+    assert knob.pending == 3.0 and echo.input == 2.0
+    assert not knob.flush()
+
+
+def test_remote():
+    """
+    Test remote variables linked to a socket server
+    """
+
+    parameter = Parameter(1.5)
+
+    server = SocketServer(knobs={"p": parameter})
+    server.update({"Time": 0.0, "p": 1.5, "x": 3, "y": 4})
+
+    address = f"{server.ip_address}::{server.port}"
+
+    try:
+        p = Remote(address, "p")
+        x = Remote(address, "x")
+
+        # both variables share one connection
+        assert p._connection is x._connection
+        assert p.settable and not x.settable
+
+        assert p.value == 1.5 and x.value == 3
+
+        p.value = 2.5
+        assert p.value == 2.5 and parameter.value == 2.5
+
+        # subscribed variables receive values pushed upon server updates
+        y = Remote(address, "y", subscribe=True)
+        assert y.subscribed and y.value == 4
+
+        server.update({"Time": 1.0, "p": 2.5, "x": 3, "y": 5})
+
+        for _ in range(100):
+            if y.value == 5:
+                break
+            time.sleep(0.01)
+
+        assert y.value == 5
+
+        # arrays are sent as binary frames
+        server.update({"Time": 2.0, "p": 2.5, "x": 3, "y": 5, "z": np.eye(3)})
+
+        z = Remote(address, "z")
+        assert np.array_equal(z.value, np.eye(3))
+
+    finally:
+        server.terminate()
+
+
+
+def test_remote_late_reply():
+    """
+    Test that a reply arriving after its request timed out is not taken as the
+    reply to the next request
+    """
+
+    values = {"p": b"1.5", "temp": b"3.0"}
+    delays = {"p": 0.5}  # first reply for p is late
+
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+
+    def serve(client):
+        reader = SocketReader(client)
+
+        while True:
+            try:
+                request = reader.read(timeout=None)
+            except OSError:
+                break
+
+            if not request:
+                break
+
+            alias = request.split(" ")[0]
+
+            time.sleep(delays.pop(alias, 0.0))
+
+            try:
+                write_to_socket(client, alias.encode() + b" " + values[alias])
+            except OSError:
+                break
+
+    def accept():
+        while True:
+            try:
+                client = listener.accept()[0]
+            except OSError:
+                break
+
+            threading.Thread(target=serve, args=(client,), daemon=True).start()
+
+    threading.Thread(target=accept, daemon=True).start()
+
+    connection = _SocketConnection(f"127.0.0.1::{listener.getsockname()[1]}")
+
+    try:
+        assert connection.request("p ?", timeout=0.1) == [None]
+
+        time.sleep(0.6)  # late reply for p has been sent
+
+        assert connection.request("temp ?") == [b"temp 3.0"]
+        assert connection.request("p ?") == [b"p 1.5"]
+
+    finally:
+        connection.close()
+        listener.close()
+
+
+def test_remote_deadline():
+    """
+    Test that multi-get requests to a stalled server are abandoned at the step
+    deadline
+    """
+
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+
+    def serve():
+        while True:
+            try:
+                client = listener.accept()[0]
+            except OSError:
+                break
+
+            request = SocketReader(client).read(timeout=None)
+
+            if "\t" in request:  # send the header of a multi-get, then stall
+                write_to_socket(client, "2 values")
+
+    threading.Thread(target=serve, daemon=True).start()
+
+    connection = _SocketConnection(f"127.0.0.1::{listener.getsockname()[1]}")
+    connection.aliases = {"p": 1, "temp": 1}
+
+    try:
+        start = time.monotonic()
+
+        with step_deadline(start + 0.5):
+            try:
+                connection.get("p")
+                raise AssertionError("DeadlineError not raised")
+            except DeadlineError:
+                pass
+
+        assert time.monotonic() - start < 2.0
+        assert connection.multi_get
+
+    finally:
+        connection.close()
+        listener.close()
+
+def test_calibration(tmp_path, monkeypatch):
+    """
+    Test calibration tables of knobs and meters
+    """
+
+    monkeypatch.chdir(tmp_path)
+
+    with open("calibration.csv", "w") as calibration_file:
+        calibration_file.write("raw,calibrated\n0,0\n2,10\n1,4\n")
+
+    echo = Echo()
+
+    knob = Knob(instrument=echo, knob="input", calibration="calibration.csv")
+    meter = Meter(instrument=echo, meter="output", calibration="calibration.csv")
+
+    knob.value = 7.0  # raw value is 1.5
+    assert echo.input == 1.5
+    assert knob.value == 7.0 and meter.value == 7.0
+
+    assert np.allclose(knob.calibration(np.array([0.5, 1.5])), [2.0, 7.0])
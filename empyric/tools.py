@@ -1,9 +1,12 @@
+import os
 import time
 import select
 import socket
 import numbers
+import threading
 import logging
 import numpy as np
+from contextlib import contextmanager
 import logging
 
 # Set up logging
@@ -97,6 +100,49 @@ class Clock:
         return elapsed_time
 
 
+# Deadlines of experiment steps are kept per thread, so that the threads evaluating
+# variables in parallel each carry the deadline of the step they belong to
+_deadlines = threading.local()
+
+
+@contextmanager
+def step_deadline(deadline):
+    """
+    Context manager setting the deadline for all instrument communications in the
+    current thread; adapters cap the timeouts of blocking calls to the time
+    remaining and give up once the deadline has passed
+
+    :param deadline: (float) deadline as a `time.monotonic` timestamp; if None,
+                     there is no deadline
+    """
+
+    previous = getattr(_deadlines, "deadline", None)
+
+    _deadlines.deadline = deadline
+
+    try:
+        yield
+    finally:
+        _deadlines.deadline = previous
+
+
+def time_remaining():
+    """
+    Get the time remaining before the deadline set by `step_deadline` in the
+    current thread
+
+    :return: (float) time remaining in seconds, which is negative if the deadline
+             has passed, or None if there is no deadline
+    """
+
+    deadline = getattr(_deadlines, "deadline", None)
+
+    if deadline is None:
+        return None
+
+    return deadline - time.monotonic()
+
+
 def find_nearest(allowed, value, overestimate=False, underestimate=False):
     """
     Find the closest in a list of allowed values to a given value.
@@ -119,7 +165,111 @@ def find_nearest(allowed, value, overestimate=False, underestimate=False):
         return allowed[nearest[0]]
 
 
+# Tools for handling files
+def resolve_path(path):
+    """
+    Find a file in either the working directory or the parent directory thereof,
+    the latter being useful when an experiment runs in a data subdirectory of the
+    runcard directory.
+
+    :param path: (str) relative or absolute path of the file
+    :return: (str) full absolute path of the file, or None if it is not found
+    """
+
+    if os.path.isfile(path):  # path in the current working directory
+        return os.path.abspath(path)
+    elif os.path.isfile(os.path.join("..", path)):  # ... or up one level
+        return os.path.abspath(os.path.join("..", path))
+
+
+def read_calibration(path):
+    """
+    Read a calibration table from a CSV file, whose first column contains raw values
+    and whose second column contains the corresponding calibrated values. Rows that
+    are not numeric, such as column headers, are ignored.
+
+    :param path: (str) path of the file, relative to the working directory or the
+                 parent directory thereof
+    :return: (tuple) arrays of raw and calibrated values, sorted by raw value
+    """
+
+    full_path = resolve_path(path)
+
+    if full_path is None:
+        raise FileNotFoundError(f"calibration file {path} not found")
+
+    table = np.genfromtxt(full_path, delimiter=",", usecols=(0, 1), ndmin=2)
+
+    table = table[np.all(np.isfinite(table), axis=1)]
+
+    if len(table) < 2:
+        raise ValueError(f"calibration file {path} must have at least two rows")
+
+    table = table[np.argsort(table[:, 0], kind="stable")]
+
+    return table[:, 0], table[:, 1]
+
+
 # Tools for handling sockets
+
+#: first byte of messages pushed by a socket server to subscribed clients, which
+# distinguishes them from responses to requests
+push_marker = b"\x1e"
+
+
+def array_frame(label, array):
+    """
+    Encode an array as a binary frame, consisting of a header line of the form
+    '(label) ndarray (dtype) (shape) (number of bytes)' followed by the raw data
+    buffer of the array. Arrays of objects are converted to arrays of strings.
+
+    :param label: (str) label at the start of the header, e.g. a variable name
+    :param array: (array-like) array to encode
+    :return: (bytes) header line, carriage return and data buffer
+    """
+
+    array = np.atleast_1d(np.asarray(array))
+
+    if array.dtype.hasobject:
+        array = array.astype(str)
+
+    array = np.ascontiguousarray(array)
+
+    shape = "x".join(str(length) for length in array.shape)
+
+    header = f"{label} ndarray {array.dtype.str} {shape} {array.nbytes}"
+
+    return header.encode() + b"\r" + array.tobytes()
+
+
+def array_frame_header(message):
+    """
+    Parse the header line of a binary array frame (see `array_frame`)
+
+    :param message: (bytes) header line, without termination
+    :return: (tuple) label, dtype, shape and number of bytes of the array, or None
+             if the message is not an array frame header
+    """
+
+    fields = message.rsplit(b" ", 4)
+
+    if len(fields) != 5 or fields[1] != b"ndarray":
+        return None
+
+    try:
+        label = fields[0]
+        dtype = np.dtype(fields[2].decode())
+        shape = tuple(int(length) for length in fields[3].split(b"x"))
+        nbytes = int(fields[4])
+    except (ValueError, TypeError):
+        return None
+
+    if dtype.hasobject or nbytes != dtype.itemsize * int(np.prod(shape)):
+        return None
+
+    return label, dtype, shape, nbytes
+
+
 def get_ip_address(remote_ip="8.8.8.8", remote_port=80):
     """
     Connect to a server to resolve IP address; defaults to Google's DNS server
@@ -181,8 +331,6 @@ def read_from_socket(
     if timeout is None:
         timeout = default_timeout
 
-    _socket.settimeout(timeout)
-
     if nbytes is None:
         nbytes = np.inf
 
@@ -191,72 +339,220 @@ def read_from_socket(
                 "nbytes must be a non-negative integer if termination is None"
             )
 
-    null_responses = 0
-    max_nulls = 3
-
     if type(termination) == str:
         termination = termination.encode()
 
-    def is_terminated(message):
-        if isinstance(termination, bytes):
-            return termination in message
-        elif callable(termination):
-            return termination(message)
-        else:
-            return False
+    # The message is received into a buffer that grows as needed, so that each
+    # byte is copied only a bounded number of times, and only newly received
+    # bytes are searched for the termination
+    buffer = bytearray(chunk_size if nbytes == np.inf else min(nbytes, chunk_size))
+    length = 0
+
+    _socket.settimeout(timeout)  # a timeout of zero does not wait at all
+
+    try:
+        while length < nbytes:
+            if length == len(buffer):
+                buffer.extend(bytes(min(len(buffer), nbytes - length)))
+
+            request_size = min(chunk_size, len(buffer) - length)
+
+            try:
+                with memoryview(buffer) as view:
+                    received = _socket.recv_into(view[length:], request_size)
+            except ConnectionResetError as err:
+                print(
+                    f"Warning: while reading from socket at {_socket.getsockname()}, "
+                    f"got error: {err}"
+                )
+                break
+            except (socket.timeout, BlockingIOError):
+                break
 
-    message = b""
+            if received == 0:  # connection was closed
+                break
 
-    while len(message) < nbytes and null_responses < max_nulls:
-        part = b""
+            length += received
 
-        remaining_bytes = nbytes - len(message)
+            if isinstance(termination, bytes):
+                search_start = max(0, length - received - len(termination) + 1)
 
-        # Check for readability and errors
-        if timeout:
-            rlist, _, xlist = select.select([_socket], [], [_socket], timeout)
+                if buffer.find(termination, search_start, length) >= 0:
+                    break
+
+            elif callable(termination):
+                if termination(bytes(buffer[:length])):
+                    break
+    finally:
+        _socket.settimeout(default_timeout)
+
+    message = bytes(buffer[:length])
+
+    if decode:
+        return message.decode().strip()
+    else:
+        return message
+
+
+class SocketReader:
+    """
+    Buffered reader of messages from a socket. Unlike `read_from_socket`, any
+    bytes received after the termination of a message are kept for the next read,
+    so that several messages sent in succession are not lost, and large chunks can
+    be received at a time.
+
+    One reader should be used for all reads from a given socket.
+    """
+
+    def __init__(self, _socket, chunk_size=65536):
+        """
+        :param _socket: (socket.Socket) socket to read from.
+        :param chunk_size: (int) maximum number of bytes to receive on each call to
+                           the socket's recv_into method.
+        """
+
+        self.socket = _socket
+        self.chunk_size = chunk_size
+
+        self._buffer = bytearray()
+
+    @property
+    def buffered(self):
+        """Number of received bytes that have not been read yet"""
+        return len(self._buffer)
+
+    def read(self, nbytes=None, termination="\r", timeout=None, decode=True):
+        """
+        Read the next message, i.e. all bytes up to and including the termination,
+        or the next `nbytes` bytes, whichever comes first. If no complete message
+        is received before the timeout, the bytes received so far are returned.
+
+        :param nbytes: (int) number of bytes to read; defaults to infinite.
+        :param termination: (str/bytes/callable) if str or bytes, expected message
+                            termination character(s); if callable, a function that
+                            takes all received bytes as its sole argument and
+                            returns True if they form a terminated message, and
+                            False otherwise.
+        :param timeout: (numbers.Number) timeout in seconds for receiving each
+                        chunk; defaults to existing timeout of the socket.
+        :param decode: (bool) whether to return decoded string (True) or raw bytes
+                       message (False); defaults to True.
+        """
+
+        if nbytes is None:
+            nbytes = np.inf
+
+            if termination is None:
+                raise ValueError(
+                    "nbytes must be a non-negative integer if termination is None"
+                )
+
+        if type(termination) == str:
+            termination = termination.encode()
+
+        searched = 0  # number of bytes in the buffer already searched
+        end = None
+
+        while end is None:
+            if isinstance(termination, bytes):
+                start = max(0, searched - len(termination) + 1)
+
+                index = self._buffer.find(termination, start)
+
+                if index >= 0:
+                    end = index + len(termination)
+
+                searched = len(self._buffer)
+
+            elif callable(termination) and self._buffer:
+                if termination(bytes(self._buffer)):
+                    end = len(self._buffer)
+
+            if len(self._buffer) >= nbytes:
+                end = nbytes if end is None else min(end, nbytes)
+
+            elif end is None and not self._receive(timeout):
+                end = len(self._buffer)
+
+        message = bytes(self._buffer[:end])
+        del self._buffer[:end]
+
+        if decode:
+            return message.decode().strip()
         else:
-            rlist, _, xlist = select.select([_socket], [], [_socket])
+            return message
 
-        readable = _socket in rlist
-        in_error = _socket in xlist
+    def read_into(self, buffer, timeout=None):
+        """
+        Fill a writable buffer (e.g. a bytearray or memoryview) with the next bytes,
+        taking buffered bytes first and receiving the rest directly into it
 
-        if not readable:
-            break
-        elif in_error:
-            raise ConnectionError("an exception has been raised for the socket")
+        :param buffer: (bytearray/memoryview) buffer to fill.
+        :param timeout: (numbers.Number) timeout in seconds for receiving each
+                        chunk; defaults to existing timeout of the socket.
+        """
+
+        view = memoryview(buffer).cast("B")
+
+        buffered = min(len(self._buffer), len(view))
+
+        view[:buffered] = self._buffer[:buffered]
+        del self._buffer[:buffered]
+
+        view = view[buffered:]
+
+        default_timeout = self.socket.gettimeout()
+
+        if timeout is not None:
+            self.socket.settimeout(timeout)
 
         try:
+            while len(view) > 0:
+                try:
+                    received = self.socket.recv_into(view)
+                except BlockingIOError:  # nothing to receive with a zero timeout
+                    raise socket.timeout("timed out")
 
-            if remaining_bytes < chunk_size:
-                part = _socket.recv(remaining_bytes)
-            else:
-                part = _socket.recv(chunk_size)
+                if received == 0:
+                    raise ConnectionError("socket connection was closed")
 
-        except ConnectionResetError as err:
-            print(
-                f"Warning: while reading from socket at {_socket.getsockname()}, "
-                f"got error: {err}"
-            )
-            break
-        except socket.timeout:
-            pass
+                view = view[received:]
+        finally:
+            self.socket.settimeout(default_timeout)
 
-        if len(part) > 0:
-            message = message + part
+    def clear(self):
+        """Discard any buffered bytes"""
+        self._buffer.clear()
 
-            if is_terminated(message):
-                break
+    def _receive(self, timeout=None):
+        # Receive the next chunk into the end of the buffer, and return the number
+        # of bytes received; zero upon timeout or if the connection was closed
 
-        else:
-            null_responses += 1
+        default_timeout = self.socket.gettimeout()
 
-    _socket.settimeout(default_timeout)
+        if timeout is not None:
+            self.socket.settimeout(timeout)  # a timeout of zero does not wait at all
 
-    if decode:
-        return message.decode().strip()
-    else:
-        return message
+        length = len(self._buffer)
+        self._buffer.extend(bytes(self.chunk_size))
+
+        received = 0
+
+        try:
+            with memoryview(self._buffer) as view:
+                received = self.socket.recv_into(view[length:])
+        except ConnectionResetError as err:
+            print(
+                f"Warning: while reading from socket at "
+                f"{self.socket.getsockname()}, got error: {err}"
+            )
+        except (socket.timeout, BlockingIOError):
+            pass
+        finally:
+            del self._buffer[length + received :]
+            self.socket.settimeout(default_timeout)
+
+        return received
 
 
 def write_to_socket(_socket, message, termination="\r", timeout=None):
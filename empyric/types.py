@@ -1,13 +1,12 @@
 # Standardization of data types
 import abc
-import os
 import re
+import types
 from abc import ABC
 
-import dill
 import pandas as pd
 import numpy as np
-from typing import Any, Union, get_origin, get_args
+from typing import Any, Callable, Union, get_origin, get_args
 
 
 class Type(ABC):
@@ -34,15 +33,37 @@ class Toggle(Type):
     on_values = [True, 1, 1.0, "1", "ON", "On", "on", b"ON", b"On", b"on"]
     off_values = [False, 0, 0.0, "0", "OFF", "Off", "off", b"OFF", b"Off", b"off"]
 
+    # on/off state of each of the values above, for fast lookups
+    _states = {
+        **{value: True for value in on_values},
+        **{value: False for value in off_values},
+    }
+
+    @classmethod
+    def state_of(cls, value) -> Union[bool, None]:
+        """
+        Get the state (True for on, False for off) represented by a value, or None if
+        the value does not represent a toggle state
+        """
+
+        try:
+            return cls._states.get(value, None)
+        except TypeError:  # unhashable value, e.g. an array
+            if value in cls.on_values:
+                return True
+            elif value in cls.off_values:
+                return False
+
     def __init__(self, state: Union[str, bool, int, type]):
         if hasattr(state, "on"):
             self.on = state.on
-        elif state in self.on_values:
-            self.on = True
-        elif state in self.off_values:
-            self.on = False
         else:
-            raise ValueError(f"toggle was initialized with invalid state {state}")
+            on = self.state_of(state)
+
+            if on is None:
+                raise ValueError(f"toggle was initialized with invalid state {state}")
+
+            self.on = on
 
     def __bool__(self):
         return True if self.on else False
@@ -63,12 +84,7 @@ class Toggle(Type):
         if hasattr(other, "on"):
             return self.on == other.on
         else:
-            if self.on and other in self.on_values:
-                return True
-            elif not self.on and other in self.off_values:
-                return True
-            else:
-                return False
+            return self.state_of(other) is self.on
 
 
 ON = Toggle("ON")
@@ -150,12 +166,11 @@ def recast(value: Any, to: type = Type) -> Union[Type, None]:
 
     Array-like values are converted into the analogous numpy array.
 
-    Strings are inspected to determine if they represent boolean or numerical
-    values and, if so, recasts values to the appropriate types. If a string
-    is a path in either the working directory or the parent directory thereof,
-    it is converted into the full absolute path. If a string does not
-    represent boolean or numerical values and is not a path, then this function
-    just returns the same string.
+    Strings are inspected to determine if they represent boolean, numerical or
+    toggle values and, if so, recasts values to the appropriate types. If a string
+    does not represent any of these, then this function just returns the same
+    string. Strings are never checked against the filesystem; where a path is
+    expected, use `empyric.tools.resolve_path`.
 
     If the value argument does not fit into one of the above categories, a
     warning will be printed and None will be returned.
@@ -167,85 +182,233 @@ def recast(value: Any, to: type = Type) -> Union[Type, None]:
     """
 
     if to != Type:
-        if value is None:
-            return None
+        return caster(to)(value)
+
+    # infer type
+    kind = _kind_of(value)
+
+    if kind is Boolean:
+        return np.bool_(value)
+    elif kind is Toggle:
+        return value
+    elif kind is Integer:
+        return np.int64(value)
+    elif kind is Float:
+        return np.float64(value)
+    elif kind is Complex:
+        return np.complex128(value)
+    elif kind is String:
+        return _parse_string(value)
+    elif kind is bytes:
+        try:
+            return _parse_string(value.decode())
+        except UnicodeDecodeError:
+            return value
+    elif kind is Array:  # value is an array
+        np_array = np.array(value)  # convert to numpy array
+        rep_elem = np_array.flatten()[0]  # representative element
+        return np_array.astype(type(recast(rep_elem)))
+    else:
+        print(f"Warning: unable to recast value {value} of type {type(value)}")
 
-        for dtype in np.array([to], dtype=object).flatten():
-            # Recast to desired type
-            try:
-                if get_origin(dtype) is Union:
-                    # Expand type unions
-                    return recast(value, to=get_args(dtype))
-
-                if issubclass(dtype, Boolean):
-                    return np.bool_(value)
-                elif issubclass(dtype, Toggle):
-                    return Toggle(value)
-                elif issubclass(dtype, Integer):
-                    return np.int64(value)
-                elif issubclass(dtype, Float):
-                    return np.float64(value)
-                elif issubclass(dtype, Complex):
-                    return np.complex128(value)
-                elif issubclass(dtype, String):
-                    return np.str_(value)
-                elif issubclass(dtype, Array) and np.ndim(value) > 0:
-                    if isinstance(value, np.ndarray):
-                        return value
-                    else:
-                        return np.array(value)
+        return None
+
+
+# Order in which kinds of values are checked when inferring types in `recast`
+_kinds = (Boolean, Toggle, Integer, Float, Complex, String, bytes, Array)
+
+# Kind of value for each class, memoized by `_kind_of`
+_kinds_by_class = {}
+
+
+def _kind_of(value: Any) -> Union[type, None]:
+    """Get the first of `_kinds` that a value is an instance of"""
+
+    cls = type(value)
+
+    try:
+        return _kinds_by_class[cls]
+    except KeyError:
+        pass
+
+    kind = None
+    for _kind in _kinds:
+        if isinstance(value, _kind):
+            kind = _kind
+            break
+
+    _kinds_by_class[cls] = kind
+
+    return kind
+
+
+# Compiled patterns for parsing numbers from strings
+_integer_pattern = re.compile(r"[-+]?[0-9]+")
+_float_pattern = re.compile(r"[-+]?[0-9]*\.?[0-9]+([eE][-+]?[0-9]+)?")
+
+
+def _parse_string(value: str) -> Union[Type, None]:
+    """Infer the type of value represented by a string and recast accordingly"""
+
+    if value[:1] in _numeric_starts:
+        if _integer_pattern.fullmatch(value):  # integer
+            return np.int64(value)
+        elif _float_pattern.fullmatch(value):  # float
+            return float(value)
+
+    lowered = value.lower()
+
+    if lowered == "true":  # boolean True
+        return np.bool_(True)
+    elif lowered == "false":  # boolean False
+        return np.bool_(False)
+
+    on = Toggle._states.get(value, None)
+
+    if on is not None:  # Toggle
+        return ON if on else OFF
+
+    return value  # must be an actual string
+
+
+# First characters of strings that could represent numbers
+_numeric_starts = frozenset("+-.0123456789")
+
+
+# Conversion functions for each type, chosen once per type by `caster`
+_casters = {}
+
+
+def _converter(dtype: type) -> Callable:
+    """
+    Get the function which converts a value to a single type; the returned function
+    raises a `ValueError` if the value cannot be converted.
+    """
+
+    if get_origin(dtype) in (Union, types.UnionType):
+        # Expand type unions
+        return caster(get_args(dtype))
+
+    if issubclass(dtype, Boolean):
+        return np.bool_
+    elif issubclass(dtype, Toggle):
+        return Toggle
+    elif issubclass(dtype, Integer):
+        return np.int64
+    elif issubclass(dtype, Float):
+        return np.float64
+    elif issubclass(dtype, Complex):
+        return np.complex128
+    elif issubclass(dtype, String):
+        return np.str_
+    elif issubclass(dtype, Array):
+
+        def to_array(value):
+            if isinstance(value, np.ndarray):
+                return value
+            elif np.ndim(value) > 0:
+                return np.array(value)
+            else:
+                raise ValueError(f"{value} is not array-like")
+
+        return to_array
+    else:
+
+        def unconvertible(value):
+            raise ValueError(f"{value} cannot be converted to {dtype}")
 
+        return unconvertible
+
+
+def caster(to: type = Type) -> Callable[[Any], Union[Type, None]]:
+    """
+    Get a function which recasts values to the given type, equivalent to calling
+    `recast` with the `to` keyword argument. The conversion for the type is looked up
+    once and reused for all subsequent calls, which is much faster for repeated
+    conversions to the same type.
+
+    :param to: (Type) type to convert to; default value is `Type` which indicates
+               that the type should be inferred based on the value.
+    """
+
+    try:
+        return _casters[to]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable collection of types
+        pass
+
+    if to is Type:
+        return recast
+
+    converters = [_converter(dtype) for dtype in np.array([to], dtype=object).flatten()]
+
+    if len(converters) == 1:
+        convert = converters[0]
+
+        def cast(value):
+            if value is None:
+                return None
+
+            try:
+                return convert(value)
             except ValueError:
                 pass
 
-        print(f"Warning: unable to recast value {value} to type {to}")
+            print(f"Warning: unable to recast value {value} to type {to}")
 
-        return None
+            return None
 
     else:
-        # infer type
-        if isinstance(value, Boolean):
-            return np.bool_(value)
-        elif isinstance(value, Toggle):
-            return value
-        elif isinstance(value, Integer):
-            return np.int64(value)
-        elif isinstance(value, Float):
-            return np.float64(value)
-        elif isinstance(value, Complex):
-            return np.complex128(value)
-        elif isinstance(value, String):
-            if value.lower() == "true":  # boolean True
-                return np.bool_(True)
-            elif value.lower() == "false":  # boolean False
-                return np.bool_(False)
-            elif re.fullmatch("[-+]?[0-9]+", value):  # integer
-                return np.int64(value)
-            elif re.fullmatch("[-+]?[0-9]*\.?[0-9]+([eE][-+]?[0-9]+)?", value):
-                # float
-                return float(value)
-            elif value in (Toggle.on_values + Toggle.off_values):  # Toggle
-                return Toggle(value)
-            elif os.path.isfile(value):  # path in the current working directory
-                return os.path.abspath(value)
-            elif os.path.isfile(os.path.join("..", value)):  # ... or up one level
-                return os.path.abspath(os.path.join("..", value))
-            else:
-                return value  # must be an actual string
-        elif isinstance(value, bytes):
-            if value[:5] == b"dlpkl":
-                # pickled object
-                return dill.loads(value[5:])
-            else:
+
+        def cast(value):
+            if value is None:
+                return None
+
+            for convert in converters:
                 try:
-                    return recast(value.decode())
-                except UnicodeDecodeError:
-                    return value
-        if isinstance(value, Array):  # value is an array
-            np_array = np.array(value)  # convert to numpy array
-            rep_elem = np_array.flatten()[0]  # representative element
-            return np_array.astype(type(recast(rep_elem)))
-        else:
-            print(f"Warning: unable to recast value {value} of type {type(value)}")
+                    return convert(value)
+                except ValueError:
+                    pass
+
+            print(f"Warning: unable to recast value {value} to type {to}")
 
             return None
+
+    try:
+        _casters[to] = cast
+    except TypeError:  # unhashable collection of types
+        pass
+
+    return cast
+
+
+# Supported types of values, memoized by class
+_inferred_types = {}
+
+
+def infer_type(value: Any) -> Union[type, None]:
+    """
+    Determine which supported type (subclass of `Type`) a value belongs to, or return
+    None if it does not belong to any. Membership of the abstract base classes is
+    determined by class registration, so the result is memoized by the class of the
+    value.
+
+    :param value: (Any) the value whose type needs to be determined
+    """
+
+    cls = type(value)
+
+    try:
+        return _inferred_types[cls]
+    except KeyError:
+        pass
+
+    inferred = None
+    for _type in supported.values():
+        if _type is not Type and isinstance(value, _type):
+            inferred = _type
+
+    _inferred_types[cls] = inferred
+
+    return inferred
@@ -1,19 +1,31 @@
 # Experiment variables
 
 import numbers
+import queue
 import socket
+import threading
 import time
 import typing
+import weakref
 from functools import wraps
 
-import dill
 import numpy as np  # used in Expression's eval call
 
+from empyric.adapters import DeadlineError
 from empyric.collection.instrument import Instrument
 
 from empyric.instruments import ModbusClient
-from empyric.tools import write_to_socket, read_from_socket, logger
-from empyric.types import supported as supported_types, recast
+from empyric.tools import (
+    write_to_socket,
+    SocketReader,
+    convert_time,
+    logger,
+    push_marker,
+    array_frame_header,
+    read_calibration,
+    time_remaining,
+)
+from empyric.types import supported as supported_types, recast, caster, infer_type
 from empyric.types import Type, Boolean, Float, Integer, Toggle, ON, Array
 
 
@@ -56,29 +68,44 @@ class Variable:
         # overwritten by child classes
         pass
 
+    # function used to recast values to the variable's type, and that type
+    _caster = None
+    _caster_type = None
+
+    def _recast(self, value):
+        """
+        Recast a value to the variable's type, with the conversion function chosen
+        only once for each type
+        """
+
+        if self._caster_type is not self._type:
+            self._caster = caster(self._type)
+            self._caster_type = self._type
+
+        return self._caster(value)
+
     @staticmethod
     def setter_type_validator(setter):
         """Checks that set value is compatible with variable's type"""
 
         @wraps(setter)
         def wrapped_setter(self, value):
-            if not isinstance(value, Array) and (
-                value is None or value == float("nan")
-            ):
+            if value is None:
                 self._value = None
 
             elif self._type is not None:
-                setter(self, recast(value, to=self._type))
+                setter(self, self._recast(value))
             else:
                 # if type is not explicitly defined upon construction,
                 # infer from first set value
 
                 recasted_value = recast(value)
 
-                for _type in supported_types.values():
-                    if isinstance(recasted_value, _type):
-                        self._type = _type
-                        setter(self, recasted_value)
+                _type = infer_type(recasted_value)
+
+                if _type is not None:
+                    self._type = _type
+                    setter(self, recasted_value)
 
         return wrapped_setter
 
@@ -90,23 +117,22 @@ class Variable:
         def wrapped_getter(self):
             value = getter(self)
 
-            if not isinstance(value, Array) and (
-                value is None or value == float("nan")
-            ):
+            if value is None:
                 self._value = None
 
             elif self._type is not None:
-                self._value = recast(value, to=self._type)
+                self._value = self._recast(value)
             else:
                 # if type is not explicitly defined upon construction,
                 # infer from first set value
 
                 recasted_value = recast(value)
 
-                for _type in supported_types.values():
-                    if isinstance(recasted_value, _type):
-                        self._type = _type
-                        self._value = recasted_value
+                _type = infer_type(recasted_value)
+
+                if _type is not None:
+                    self._type = _type
+                    self._value = recasted_value
 
             return self._value
 
@@ -140,6 +166,49 @@ class Variable:
             return self._value == other
 
 
+class _Calibration:
+    """
+    Calibration of raw values by linear interpolation of a table read from a file
+    (see `empyric.tools.read_calibration`)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.raw, self.calibrated = read_calibration(path)
+
+        # the inverse is defined only if the calibrated values are monotonic
+        steps = np.diff(self.calibrated)
+
+        if np.all(steps > 0):
+            self._inverse_table = (self.calibrated, self.raw)
+        elif np.all(steps < 0):
+            self._inverse_table = (self.calibrated[::-1], self.raw[::-1])
+        else:
+            self._inverse_table = None
+
+    @property
+    def invertible(self):
+        """Whether the calibrated values are strictly monotonic"""
+        return self._inverse_table is not None
+
+    @staticmethod
+    def applies_to(value):
+        """Whether a value is a real number or an array of real numbers"""
+
+        if isinstance(value, np.ndarray):
+            return value.dtype.kind in "iuf"
+        else:
+            return isinstance(value, numbers.Real)
+
+    def __call__(self, value):
+        """Calibrate a raw value"""
+        return np.interp(value, self.raw, self.calibrated)
+
+    def inverse(self, value):
+        """Get the raw value corresponding to a calibrated value"""
+        return np.interp(value, *self._inverse_table)
+
+
 class Knob(Variable):
     """
     Variable that can be directly controlled by an instrument, such as the
@@ -159,10 +228,45 @@ class Knob(Variable):
     be multiplied by the `multiplier` and then increased by the `offset`. Set commands
     to the instrument will take the knob value, subtract the `offset` and divide by the
     `multiplier`.
+
+    The optional `calibration` keyword argument is the path of a CSV file whose first
+    two columns are raw knob values and the corresponding calibrated values. Readings
+    from the instrument are calibrated by linear interpolation of this table, before
+    any `multiplier` and `offset` are applied, and set commands to the instrument are
+    converted back to raw values by the inverse interpolation. The calibrated values
+    must therefore be strictly increasing or decreasing.
+
+    The optional `cache` keyword argument sets when the knob value is queried from the
+    instrument. If set to 'always' (default), the instrument is queried on every
+    evaluation. If set to 'on-write', the instrument is queried only on the first
+    evaluation, after which the last known value stored by the instrument (which is
+    updated whenever the knob is set) is returned. If set to a dictionary of the form
+    {'ttl': time}, e.g. {'ttl': '5 seconds'}, the stored value is returned if the
+    instrument was queried or set within that time. The `cached` attribute indicates
+    whether the most recent value was retrieved from the stored value.
+
+    The optional `deadband` keyword argument suppresses writes of values within the
+    deadband of the last confirmed value of the knob (the value read back after the
+    last write or query). A deadband of 0 suppresses only writes of identical values.
+    Note that a ramp whose change per step is smaller than the deadband will stall.
+
+    If the optional `coalesce` keyword argument is True, writes are held until the
+    `flush` method is called, so that only the last of several writes in between
+    flushes reaches the instrument. Experiments flush all knobs once per step, after
+    the routines have been updated. Writes are also held, regardless of `coalesce`,
+    while the `write_interval` of the instrument's adapter has not yet passed since
+    the last write through any knob of the same instrument.
     """
 
     _settable = True  #:
 
+    #: whether the most recent value was the stored value rather than a query result
+    cached = False
+
+    # times of the most recent knob writes to each instrument
+    _last_writes = weakref.WeakKeyDictionary()
+    _last_writes_lock = threading.Lock()
+
     def __init__(
         self,
         instrument: Instrument,
@@ -171,10 +275,36 @@ class Knob(Variable):
         upper_limit: typing.Union[float, int] = None,
         multiplier: typing.Union[float, int] = 1,
         offset: typing.Union[float, int] = 0,
+        calibration: str = None,
+        cache: typing.Union[str, dict] = "always",
+        deadband: typing.Union[float, int] = None,
+        coalesce: bool = False,
     ):
         self.instrument = instrument
         self.knob = knob  # name of the knob on instrument
 
+        # Time for which the stored knob value is valid after a query or set
+        if cache == "always":
+            self.cache_ttl = 0.0
+        elif cache == "on-write":
+            self.cache_ttl = np.inf
+        elif isinstance(cache, dict) and "ttl" in cache:
+            self.cache_ttl = convert_time(cache["ttl"])
+        else:
+            raise ValueError(
+                f"invalid cache policy {cache} for knob {knob}; must be 'always', "
+                "'on-write' or a dictionary of the form {'ttl': time}"
+            )
+
+        self._last_refresh = None  # time of the last query or set of the knob
+
+        self.deadband = deadband
+        self.coalesce = coalesce
+
+        self._confirmed = None  # last value read back from the instrument
+        self._pending = None  # value waiting to be written to the instrument
+        self._pending_lock = threading.Lock()
+
         self.lower_limit = lower_limit
         self.upper_limit = upper_limit
 
@@ -185,6 +315,17 @@ class Knob(Variable):
         self.multiplier = multiplier
         self.offset = offset
 
+        if calibration is not None:
+            self.calibration = _Calibration(calibration)
+
+            if not self.calibration.invertible:
+                raise ValueError(
+                    f"calibrated values in {calibration} for knob {knob} must be "
+                    "strictly increasing or decreasing"
+                )
+        else:
+            self.calibration = None
+
         # infer type from type hint of first argument of set method
         set_method = getattr(instrument, "set_" + knob.replace(" ", "_"))
         type_hints = typing.get_type_hints(set_method)
@@ -202,6 +343,9 @@ class Knob(Variable):
 
             self._type = np.float64
 
+        if self.calibration is not None and self._type in [Integer, Boolean]:
+            self._type = Float  # calibrated values are interpolated
+
         self._value = None
 
     @property
@@ -211,10 +355,26 @@ class Knob(Variable):
         Value of the knob of an instrument
         """
 
-        self._value = self.instrument.get(self.knob)
+        now = time.time()
 
-        if isinstance(self._value, numbers.Number):
-            self._value = self.multiplier * self._value + self.offset
+        if (
+            self._last_refresh is not None
+            and now - self._last_refresh < self.cache_ttl
+        ):
+            self._value = getattr(self.instrument, self.knob.replace(" ", "_"))
+            self.cached = True
+        else:
+            self._value = self.instrument.get(self.knob)
+            self._last_refresh = now
+
+            # knobs without get methods always return the stored value
+            self.cached = not hasattr(
+                self.instrument, "get_" + self.knob.replace(" ", "_")
+            )
+
+        self._value = self._transform(self._value)
+
+        self._confirmed = self._value
 
         self.last_evaluation = time.time()
 
@@ -228,41 +388,131 @@ class Knob(Variable):
         """
 
         try:
+            if (self.upper_limit is not None) and (value > self.upper_limit):
+                value = self.upper_limit
 
-            upper_limit_exceeded = (self.upper_limit is not None) and (
-                value > self.upper_limit
-            )
+            if (self.lower_limit is not None) and (value < self.lower_limit):
+                value = self.lower_limit
+
+        except TypeError as type_error:
+            logger.warning(str(type_error))
+
+            self._read_back()
+            return
+
+        with self._pending_lock:
+            if self._within_deadband(value):
+                # the instrument is already there; drop any held write
+                self._pending = None
+                return
+
+            self._pending = value
+
+        if not self.coalesce:
+            self.flush()
+
+    @property
+    def pending(self):
+        """
+        Value waiting to be written to the instrument, or None if there is none
+        """
 
-            lower_limit_exceeded = (self.lower_limit is not None) and (
-                value < self.lower_limit
+        return self._pending
+
+    def flush(self):
+        """
+        Write the pending value, if any, to the instrument, unless the write interval
+        of the instrument's adapter has not yet passed since the last knob write to
+        the instrument, in which case the value remains pending
+
+        :return: (bool) True if a value was written, False otherwise
+        """
+
+        with self._pending_lock:
+            if self._pending is None:
+                return False
+
+            write_interval = convert_time(
+                getattr(self.instrument.adapter, "write_interval", 0.0)
             )
 
-            if upper_limit_exceeded:
-                self.instrument.set(
-                    self.knob, (self.upper_limit - self.offset) / self.multiplier
-                )
+            with Knob._last_writes_lock:
+                now = time.time()
+                last_write = Knob._last_writes.get(self.instrument, -np.inf)
 
-            if lower_limit_exceeded:
-                self.instrument.set(
-                    self.knob, (self.lower_limit - self.offset) / self.multiplier
-                )
+                if now - last_write < write_interval:
+                    return False
 
-            if not upper_limit_exceeded and not lower_limit_exceeded:
-                if isinstance(value, numbers.Number):
-                    self.instrument.set(
-                        self.knob, (value - self.offset) / self.multiplier
-                    )
-                else:
-                    self.instrument.set(self.knob, value)
+                Knob._last_writes[self.instrument] = now
 
-        except TypeError as type_error:
+            value, self._pending = self._pending, None
+
+        try:
+            self.instrument.set(self.knob, self._untransform(value))
 
+        except TypeError as type_error:
             logger.warning(str(type_error))
 
+        self._read_back()
+
+        return True
+
+    def _read_back(self):
+        """
+        Update the knob value from the value stored by the instrument
+        """
+
         self._value = self.instrument.__getattribute__(self.knob.replace(" ", "_"))
+        self._last_refresh = time.time()
 
-        if isinstance(self._value, numbers.Number):
-            self._value = self.multiplier * self._value + self.offset
+        self._value = self._transform(self._value)
+
+        self._confirmed = self._value
+
+    def _transform(self, value):
+        """
+        Convert a raw value from the instrument to a knob value
+        """
+
+        if self.calibration is not None and _Calibration.applies_to(value):
+            value = self.calibration(value)
+
+        if isinstance(value, numbers.Number):
+            value = self.multiplier * value + self.offset
+
+        return value
+
+    def _untransform(self, value):
+        """
+        Convert a knob value to a raw value for the instrument
+        """
+
+        if isinstance(value, numbers.Number):
+            value = (value - self.offset) / self.multiplier
+
+        if self.calibration is not None and _Calibration.applies_to(value):
+            value = self.calibration.inverse(value)
+
+        return value
+
+    def _within_deadband(self, value):
+        """
+        Check whether a value is within the deadband of the last confirmed value
+        """
+
+        if self.deadband is None or self._confirmed is None:
+            return False
+
+        try:
+            if isinstance(value, numbers.Number) and isinstance(
+                self._confirmed, numbers.Number
+            ):
+                return bool(abs(value - self._confirmed) <= self.deadband)
+            else:
+                return bool(np.all(value == self._confirmed))
+
+        except (TypeError, ValueError):
+            return False
 
     def __str__(self):
         return f"Knob({self.value})"
@@ -285,11 +535,18 @@ class Meter(Variable):
     the meter, as in the usual experiment loop, is not desirable. Generally,
     it should be a variable of integer, boolean or toggle type. When the gate
     variable evaluates to 1/True/On, the meter can be measured. Otherwise,
-    attempts to measure the meter will have no effect (`None` is returned).
+    attempts to measure the meter will have no effect (`None` is returned). The
+    `measure` method measures the meter regardless of the gate, which allows an
+    experiment to evaluate a gate shared by several meters only once.
 
     The optional `multiplier` and `offset` keyword arguments provide a means to affect
     a linear transformation of the raw meter value. Readings from the instrument will
     be multiplied by the `multiplier` and then increased by the `offset`.
+
+    The optional `calibration` keyword argument is the path of a CSV file whose first
+    two columns are raw meter values and the corresponding calibrated values.
+    Readings from the instrument, including arrays, are calibrated by linear
+    interpolation of this table, before any `multiplier` and `offset` are applied.
     """
 
     _settable = False  #:
@@ -301,13 +558,19 @@ class Meter(Variable):
         gate=None,
         multiplier: typing.Union[float, int] = 1,
         offset: typing.Union[float, int] = 0,
+        calibration: str = None,
     ):
         self.instrument = instrument
         self.meter = meter
         self.multiplier = multiplier
         self.offset = offset
 
-        if gate and isinstance(gate, Variable):
+        if calibration is not None:
+            self.calibration = _Calibration(calibration)
+        else:
+            self.calibration = None
+
+        if isinstance(gate, Variable):
             self.gate = gate
         else:
             self.gate = Parameter(ON)
@@ -316,20 +579,36 @@ class Meter(Variable):
             getattr(instrument, "measure_" + meter.replace(" ", "_"))
         ).get("return", np.float64)
 
+        if self.calibration is not None and self._type in [Integer, Boolean]:
+            self._type = Float  # calibrated values are interpolated
+
         self._value = None
 
     @property
-    @Variable.getter_type_validator
     def value(self):
         """
-        Measured value of the meter of an instrument
+        Measured value of the meter of an instrument, or None if the gate is closed
         """
 
         if not self.gate.value:
+            self._value = None
             return None
 
+        return self.measure()
+
+    @Variable.getter_type_validator
+    def measure(self):
+        """
+        Measure the meter, regardless of the gate
+
+        :return: measured value
+        """
+
         self._value = self.instrument.measure(self.meter)
 
+        if self.calibration is not None and _Calibration.applies_to(self._value):
+            self._value = self.calibration(self._value)
+
         if isinstance(self._value, numbers.Number):
             self._value = self.multiplier * self._value + self.offset
 
@@ -382,6 +661,13 @@ class Expression(Variable):
         "demod(": "self.demod(",
     }
 
+    # Spectra of signals shared by all expressions; cleared on each experiment step
+    # via the `clear_spectra` method
+    _spectra = {}
+    _frequencies = {}
+    _spectra_lock = threading.Lock()
+    _max_spectra = 64  # bounds the cache when used outside an experiment
+
     def __init__(self, expression: str, definitions: dict = None):
         self.expression = expression
         self.definitions = definitions if definitions is not None else {}
@@ -464,10 +750,60 @@ class Expression(Variable):
             )
 
     # Utility functions for Fourier analysis
+    @classmethod
+    def clear_spectra(cls):
+        """Clear the cache of signal spectra and frequency grids"""
+        with cls._spectra_lock:
+            cls._spectra.clear()
+            cls._frequencies.clear()
+
+    @classmethod
+    def _spectrum(cls, s):
+        """
+        Get the (unnormalized) fast Fourier transform of a signal, reusing the
+        transform of the same signal object if it has already been calculated since
+        the last call to `clear_spectra`
+        """
+
+        with cls._spectra_lock:
+            cached = cls._spectra.get(id(s), None)
+
+        # the cache holds a reference to each signal, so its id cannot be reused
+        if cached is not None and cached[0] is s:
+            return cached[1]
+
+        spectrum = np.fft.fft(s)
+
+        with cls._spectra_lock:
+            if len(cls._spectra) >= cls._max_spectra:
+                cls._spectra.pop(next(iter(cls._spectra)))
+
+            cls._spectra[id(s)] = (s, spectrum)
+
+        return spectrum
+
+    @classmethod
+    def _fftfreq(cls, n, dt):
+        """Get the frequency grid of an FFT with `n` samples spaced by `dt`"""
+
+        with cls._spectra_lock:
+            freqs = cls._frequencies.get((n, dt), None)
+
+        if freqs is None:
+            freqs = np.fft.fftfreq(n, d=dt)
+
+            with cls._spectra_lock:
+                if len(cls._frequencies) >= cls._max_spectra:
+                    cls._frequencies.pop(next(iter(cls._frequencies)))
+
+                cls._frequencies[(n, dt)] = freqs
+
+        return freqs
+
     @staticmethod
     def fft(s):
         """Calculate the fast Fourier transform of a signal"""
-        return np.fft.fft(s, norm="forward")
+        return Expression._spectrum(s) / len(s)
 
     @staticmethod
     def ifft(s):
@@ -477,8 +813,8 @@ class Expression(Variable):
     @staticmethod
     def _find_carrier(s, dt, f0=0.0, bw=np.inf):
         """Characterize the carrier wave of a signal"""
-        fft_s = np.fft.fft(s, norm="forward")
-        f = np.fft.fftfreq(len(s), d=dt)
+        fft_s = Expression.fft(s)
+        f = Expression._fftfreq(len(s), dt)
 
         in_band = (f > f0 - 0.5 * bw) & (f < f0 + 0.5 * bw)
 
@@ -524,10 +860,15 @@ class Expression(Variable):
 
         partitions_demod = np.empty_like(partitions, dtype=np.complex128)
 
+        freq = Expression._fftfreq(k_partition, dt)  # frequency values for the FFT
+
         for i, partition in enumerate(partitions):
             # Calculate FFT
-            freq = np.fft.fftfreq(k_partition, d=dt)  # frequency values for the FFT
-            fft = np.fft.fft(partition)
+            if n_parts == 1 and k_partition == len(s):
+                # the partition is the signal itself
+                fft = Expression._spectrum(s)  # shared with other spectral functions
+            else:
+                fft = np.fft.fft(partition)
 
             # Find principal frequency within the given band about the given frequency
             fft_in_positive_band = np.abs(
@@ -567,6 +908,412 @@ class Expression(Variable):
         return np.abs(signal_demod)
 
 
+class _SocketConnection:
+    """
+    Connection to a socket server, shared by all remote variables linked to that
+    server
+    """
+
+    def __init__(self, server: str):
+        self.server = server
+
+        self._connect()
+
+        self.lock = threading.RLock()
+
+        # aliases of the remote variables using the connection, with the number of
+        # remote variables using each
+        self.aliases = {}
+
+        # responses to value queries from the last multi-get, with the time of the
+        # multi-get, for each alias
+        self._responses = {}
+
+        self.multi_get = True  # set to False if the server does not support it
+
+        # subscribed aliases, and the latest value responses pushed by the server
+        self.subscriptions = set()
+        self.pushed = {}
+
+        # once subscribed, a reader thread receives all messages from the server,
+        # putting responses to requests in this queue
+        self._replies = None
+        self._closed = False
+
+        # aliases resubscribed after reconnecting, whose confirmations are dropped
+        self._resubscribing = set()
+
+    def _connect(self):
+        """Open the socket connection to the server"""
+
+        server_ip, server_port = self.server.split("::")
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.connect((server_ip, int(server_port)))
+
+        self.reader = SocketReader(self.socket)
+
+    def _reconnect(self):
+        """
+        Replace the connection to the server after a request timed out, so that
+        late responses to that request are not taken as responses to later ones
+        """
+
+        logger.warning(
+            f"Request to socket server at {self.server} timed out; reconnecting"
+        )
+
+        with self.lock:
+            try:
+                self.socket.shutdown(socket.SHUT_RDWR)
+            except OSError:  # server is already disconnected
+                pass
+
+            self.socket.close()
+
+            self._responses = {}
+
+            try:
+                self._connect()
+            except OSError as error:
+                logger.warning(
+                    f"Unable to reconnect to socket server at {self.server}: {error}"
+                )
+                return
+
+            if self._replies is not None:
+                self._replies = queue.Queue()
+
+                threading.Thread(
+                    target=self._read_forever,
+                    args=(self.reader, self._replies),
+                    daemon=True,
+                ).start()
+
+                # the server only pushes values to the new connection once
+                # resubscribed
+                self._resubscribing = set(self.subscriptions)
+
+                for alias in self.subscriptions:
+                    write_to_socket(self.socket, f"{alias} subscribe")
+
+    def request(self, message, count=1, timeout=60):
+        """
+        Send a request to the server and receive the response(s)
+
+        :param message: (str) request message
+        :param count: (int) number of responses expected
+        :param timeout: (float) timeout for each response in seconds, capped to the
+                        time remaining before the step deadline, if any
+        :return: (list) list of raw responses
+        """
+
+        self._capped_timeout(timeout, f"requesting {message}")
+
+        with self.lock:
+            write_to_socket(self.socket, message)
+
+            return self._next_responses(count, timeout, f"response to {message}")
+
+    def _next_responses(self, count, timeout, description):
+        """
+        Get the next responses to a request, resetting the connection if any of
+        them is not received
+
+        :param count: (int) number of responses expected
+        :param timeout: (float) timeout for each response in seconds, capped to the
+                        time remaining before the step deadline, if any
+        :param description: (str) description of the responses, for error messages
+        :return: (list) list of raw responses
+        """
+
+        responses = []
+
+        try:
+            for _ in range(count):
+                capped = self._capped_timeout(timeout, f"receiving {description}")
+
+                responses.append(self._next_response(timeout=capped))
+        except DeadlineError:
+            self._reconnect()  # remaining responses would arrive late
+            raise
+
+        if None in responses:
+            self._reconnect()
+
+        return responses
+
+    def _capped_timeout(self, timeout, action):
+        """
+        Cap a timeout to the time remaining before the step deadline, if any
+
+        :param timeout: (float) timeout in seconds
+        :param action: (str) description of the action, for the error message
+        :return: (float) capped timeout in seconds
+        """
+
+        remaining = time_remaining()
+
+        if remaining is not None:
+            if remaining <= 0:
+                raise DeadlineError(
+                    f"Step deadline passed before {action} from {self.server}"
+                )
+
+            timeout = min(timeout, remaining)
+
+        return timeout
+
+    def _next_response(self, timeout=60):
+        """
+        Get the next response to a request, storing any pushed values received
+        before it
+
+        :param timeout: (float) timeout in seconds
+        :return: (bytes) response, or None if no response was received
+        """
+
+        if self._replies is not None:
+            try:
+                return self._replies.get(timeout=timeout)
+            except queue.Empty:
+                return None
+
+        response = self._receive(timeout=timeout)
+
+        while response is not None and self._store_push(response):
+            response = self._receive(timeout=timeout)
+
+        return response
+
+    def _store_push(self, message):
+        """
+        Store the value response in a message pushed by the server
+
+        :param message: (bytes) message received from the server
+        :return: (bool) True if the message was pushed, False otherwise
+        """
+
+        header = message[0] if isinstance(message, tuple) else message
+
+        if not header.startswith(push_marker):
+            return False
+
+        alias, _, response = header[len(push_marker) :].partition(b"\t")
+
+        if isinstance(message, tuple):  # array frame
+            response = (response, message[1])
+
+        self.pushed[alias.decode()] = response
+
+        return True
+
+    def _read_forever(self, reader, replies):
+        """
+        Receive messages from the server until the connection is closed or
+        replaced
+
+        :param reader: (SocketReader) reader of the connection
+        :param replies: (queue.Queue) queue of responses to requests
+        """
+
+        while not self._closed and reader is self.reader:
+            try:
+                message = self._receive(timeout=1, reader=reader)
+            except (OSError, ValueError):  # socket was closed
+                break
+
+            if message is None or self._store_push(message):
+                continue
+
+            # confirmations of resubscriptions are not responses to any request
+            if isinstance(message, bytes) and message.endswith(b" subscribed"):
+                alias = message[: -len(b" subscribed")].decode()
+
+                if alias in self._resubscribing:
+                    self._resubscribing.discard(alias)
+                    continue
+
+            replies.put(message)
+
+    def _receive(self, timeout=60, reader=None):
+        """
+        Receive the next carriage-return-terminated response from the server
+
+        :param timeout: (float) timeout in seconds
+        :param reader: (SocketReader) reader to receive from; defaults to the
+                       reader of the current connection
+        :return: (bytes/tuple) response without termination, or None if no complete
+                 response was received; for binary array frames (see
+                 `array_frame`), a tuple of the header label and the array
+        """
+
+        reader = reader or self.reader
+
+        response = reader.read(termination=b"\r", timeout=timeout, decode=False)
+
+        if not response.endswith(b"\r"):  # incomplete response
+            return None
+
+        response = response[:-1]
+
+        header = array_frame_header(response)
+
+        if header is not None:
+            label, dtype, shape, nbytes = header
+
+            try:
+                return label, self._receive_array(
+                    dtype, shape, nbytes, timeout=timeout, reader=reader
+                )
+            except socket.timeout:  # incomplete array
+                return None
+
+        return response if response else None
+
+    def _receive_array(self, dtype, shape, nbytes, timeout=60, reader=None):
+        """
+        Receive the data buffer of a binary array frame directly into a new array
+
+        :param dtype: (numpy.dtype) data type of the array
+        :param shape: (tuple) shape of the array
+        :param nbytes: (int) size of the data buffer in bytes
+        :param timeout: (float) timeout in seconds
+        :param reader: (SocketReader) reader to receive from; defaults to the
+                       reader of the current connection
+        :return: (numpy.ndarray) received array
+        """
+
+        data = bytearray(nbytes + 1)  # includes the termination
+
+        (reader or self.reader).read_into(data, timeout=timeout)
+
+        return np.frombuffer(data, dtype=dtype, count=nbytes // dtype.itemsize).reshape(
+            shape
+        )
+
+    def get(self, alias, since=None):
+        """
+        Get the raw response to a value query of an alias. The values of all aliases
+        using the connection are fetched in a single exchange with the server, and
+        subsequent calls for the other aliases receive those responses, unless they
+        are older than the given time.
+
+        :param alias: (str) alias of the variable on the server
+        :param since: (float) time since the epoch before which previously fetched
+                      responses are too old to use
+        :return: (bytes) raw response
+        """
+
+        with self.lock:
+            response, fetched = self._responses.pop(alias, (None, None))
+
+            if fetched is not None and (since is None or fetched > since):
+                return response
+
+            aliases = [
+                _alias
+                for _alias in self.aliases
+                if _alias not in self.subscriptions or _alias == alias
+            ]
+
+            if self.multi_get and len(aliases) > 1:
+                now = time.time()
+
+                header = self.request("\t".join(aliases) + " ?")[0]
+
+                if header is None:  # request timed out and the connection was reset
+                    return None
+
+                if header == f"{len(aliases)} values".encode():
+                    responses = self._next_responses(
+                        len(aliases), 60, f"values of {', '.join(aliases)}"
+                    )
+
+                    if None in responses:  # the connection was reset
+                        return None
+
+                    self._responses = {
+                        _alias: (response, now)
+                        for _alias, response in zip(aliases, responses)
+                    }
+
+                    return self._responses.pop(alias)[0]
+
+                logger.info(
+                    f"Socket server at {self.server} does not support multi-get "
+                    "requests; querying each variable separately"
+                )
+
+                self.multi_get = False
+
+            return self.request(f"{alias} ?")[0]
+
+    def subscribe(self, alias):
+        """
+        Subscribe to pushed values of an alias, which the server sends whenever the
+        value changes
+
+        :param alias: (str) alias of the variable on the server
+        :return: (bool) True if the subscription was accepted, False otherwise
+        """
+
+        with self.lock:
+            if self._replies is None:
+                self._replies = queue.Queue()
+
+                threading.Thread(
+                    target=self._read_forever,
+                    args=(self.reader, self._replies),
+                    daemon=True,
+                ).start()
+
+            response = self.request(f"{alias} subscribe")[0]
+
+            if response == f"{alias} subscribed".encode():
+                self.subscriptions.add(alias)
+                return True
+            else:
+                return False
+
+    def unsubscribe(self, alias):
+        """
+        Cancel the subscription to pushed values of an alias; the server does not
+        respond to this request
+
+        :param alias: (str) alias of the variable on the server
+        """
+
+        with self.lock:
+            if alias in self.subscriptions:
+                self.subscriptions.remove(alias)
+                self._resubscribing.discard(alias)
+                self.pushed.pop(alias, None)
+
+                try:
+                    write_to_socket(self.socket, f"{alias} unsubscribe")
+                except OSError:  # server is already disconnected
+                    pass
+
+    def discard(self, alias):
+        """Discard any previously fetched response for an alias"""
+
+        with self.lock:
+            self._responses.pop(alias, None)
+
+    def close(self):
+        """Close the connection"""
+
+        self._closed = True
+
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:  # server is already disconnected
+            pass
+
+        self.socket.close()
+
+
 class Remote(Variable):
     """
     Variable controlled by an experiment (running a server routine) on a
@@ -599,8 +1346,23 @@ class Remote(Variable):
     be multiplied by the `multiplier` and then increased by the `offset`. Set commands
     to the server will take the variable value, subtract the `offset` and divide by the
     `multiplier`.
+
+    Remote variables linked to the same socket server share a single connection,
+    over which the values of all of them are fetched in one exchange.
+
+    If the optional `subscribe` argument is True, a remote variable on a socket
+    server subscribes to its value, which the server then pushes to the client
+    whenever it changes. Evaluating the variable then returns the latest pushed
+    value without a request to the server.
     """
 
+    #: whether the variable is subscribed to pushed values from a socket server
+    subscribed = False
+
+    # shared connections to socket servers
+    _connections = {}
+    _connections_lock = threading.Lock()
+
     type_map = {
         Toggle: "64bit_uint",
         Boolean: "64bit_uint",
@@ -618,6 +1380,7 @@ class Remote(Variable):
         upper_limit: typing.Union[float, int] = None,
         multiplier: typing.Union[float, int] = 1,
         offset: typing.Union[float, int] = 0,
+        subscribe: bool = False,
     ):
         self.server = server
         self.alias = alias
@@ -632,15 +1395,29 @@ class Remote(Variable):
             self._settable = settable
 
         else:
-            server_ip, server_port = server.split("::")
+            with Remote._connections_lock:
+                if server not in Remote._connections:
+                    Remote._connections[server] = _SocketConnection(server)
 
-            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self._connection = Remote._connections[server]
 
-            self._socket.connect((server_ip, int(server_port)))
+                with self._connection.lock:
+                    aliases = self._connection.aliases
+                    aliases[alias] = aliases.get(alias, 0) + 1
+
+            self._last_fetch = None  # time of the last value query
 
             self.get_settable()
             self.get_type()
 
+            self.subscribed = subscribe and self._connection.subscribe(alias)
+
+            if subscribe and not self.subscribed:
+                logger.warning(
+                    f"Unable to subscribe to {alias} on socket server at {server}; "
+                    "its value will be queried instead"
+                )
+
     @property
     @Variable.getter_type_validator
     def value(self):
@@ -672,32 +1449,43 @@ class Remote(Variable):
                 )
 
         else:
-            write_to_socket(self._socket, f"{self.alias} ?")
-
             logger.debug(
                 f"Retrieving value of type {self._type} "
                 f"with alias {self.alias}"
                 f"from socket server at {self.server}..."
             )
 
-            response = read_from_socket(self._socket, timeout=60, decode=False)
+            response = self._connection.pushed.get(self.alias, None)
+
+            if not self.subscribed or response is None:
+                now = time.time()
+
+                response = self._connection.get(self.alias, since=self._last_fetch)
+
+                self._last_fetch = now
 
             try:
                 if response is None:
                     self._value = None
+                elif isinstance(response, tuple):  # array frame
+                    if response[0] != self.alias.encode():
+                        raise RuntimeError(f"response is for {response[0].decode()}")
+
+                    self._value = response[1]
                 elif b"Error" in response:
                     raise RuntimeError(response.decode().split("Error: ")[-1])
                 else:
-                    bytes_value = response.split(self.alias.encode() + b" ")[-1].strip()
-
-                    if bytes_value[:5] == b"dlpkl":
-                        # pickled quantity, usually an array, list or tuple
-                        self._value = dill.loads(bytes_value[5:])
-                    else:
-                        self._value = recast(
-                            bytes_value,
-                            to=self._type if self._type is not None else Type,
-                        )
+                    label = self.alias.encode() + b" "
+
+                    if not response.startswith(label):
+                        raise RuntimeError(f"unexpected response {response.decode()}")
+
+                    bytes_value = response[len(label) :].strip()
+
+                    self._value = recast(
+                        bytes_value,
+                        to=self._type if self._type is not None else Type,
+                    )
 
                 logger.debug(
                     f"Value with alias {self.alias} retrieved "
@@ -743,9 +1531,12 @@ class Remote(Variable):
                 f"on socket server at {self.server}..."
             )
 
-            write_to_socket(self._socket, f"{self.alias} {value}")
+            self._connection.discard(self.alias)
+
+            check = self._connection.request(f"{self.alias} {value}")[0]
 
-            check = read_from_socket(self._socket, timeout=60)
+            if check is not None:
+                check = check.decode().strip()
 
             if check == "" or check is None:
                 logger.warning(
@@ -785,8 +1576,21 @@ class Remote(Variable):
         if self.protocol == "modbus":
             self._client.disconnect()
         else:
-            self._socket.shutdown(socket.SHUT_RDWR)
-            self._socket.close()
+            with Remote._connections_lock:
+                with self._connection.lock:
+                    aliases = self._connection.aliases
+                    aliases[self.alias] -= 1
+
+                    if aliases[self.alias] == 0:
+                        aliases.pop(self.alias)
+                        self._connection.discard(self.alias)
+
+                        if aliases:
+                            self._connection.unsubscribe(self.alias)
+
+                    if not aliases:
+                        self._connection.close()
+                        Remote._connections.pop(self.server, None)
 
     def get_type(self):
         """Get the data type of the remote variable"""
@@ -821,11 +1625,11 @@ class Remote(Variable):
                 f"on socket server at {self.server}..."
             )
 
-            write_to_socket(self._socket, f"{self.alias} type?")
-
-            response = read_from_socket(self._socket, timeout=60)
+            response = self._connection.request(f"{self.alias} type?")[0]
 
             if response is not None:
+                response = response.decode().strip()
+
                 for _type in supported_types:
                     if str(_type) in response.split(self.alias)[-1]:
                         self._type = supported_types.get(_type, None)
@@ -839,10 +1643,8 @@ class Remote(Variable):
 
     def get_settable(self):
         """Get settability of remote variable"""
-        write_to_socket(self._socket, f"{self.alias} settable?")
-
-        response = read_from_socket(self._socket, timeout=60)
-        self._settable = response == f"{self.alias} settable"
+        response = self._connection.request(f"{self.alias} settable?")[0]
+        self._settable = response == f"{self.alias} settable".encode()
 
     def __str__(self):
         return f"Remote({self.alias}@{self.server} = {self.value})"
@@ -864,10 +1666,7 @@ class Parameter(Variable):
     ):
         self._value = recast(parameter)
 
-        for name, _type in supported_types.items():
-            if isinstance(self._value, _type) and _type is not Type:
-
-                self._type = _type
+        self._type = infer_type(self._value)
 
         logger.debug(f"Setting data type of parameter {self._value} to {self._type}")
 